@@ -42,7 +42,7 @@ from bot.commands import (
     show_channel_status,
 )
 from bot.metrics import increment_bot_invocations, increment_unknown_commands
-from bot.utils import contains, strip_command, strip_leading_mention
+from bot.utils import strip_command, strip_leading_mention, sanitize_slack_ids
 
 # Validate environment variables at startup
 validate_environment_variables()
@@ -59,9 +59,178 @@ fastapi_app = FastAPI()
 handler = SlackRequestHandler(slack_app)
 
 
+def _stream_bug_report(clean_text, team_id, channel_id, say, client):
+    """
+    Generate a bug report with streaming enabled, posting the partial report
+    to Slack and editing it in place as more content arrives.
+    """
+    state = {"ts": None, "channel": None}
+
+    def on_progress(partial):
+        # Best-effort: a failed update should never abort generation.
+        try:
+            if state["ts"] is None:
+                response = say(partial)
+                state["ts"] = response.get("ts")
+                state["channel"] = response.get("channel")
+            else:
+                client.chat_update(channel=state["channel"], ts=state["ts"], text=partial)
+        except Exception:
+            logger.exception("Failed to post streaming bug report update")
+
+    report = generate_bug_report(
+        clean_text, team_id, channel_id=channel_id, on_progress=on_progress
+    )
+    if state["ts"] is None:
+        # No partial message was posted (short output or early error).
+        say(report)
+        return
+    try:
+        client.chat_update(channel=state["channel"], ts=state["ts"], text=report)
+    except Exception:
+        logger.exception("Failed to post final streamed bug report, falling back to say")
+        say(report)
+
+
+def _cmd_list_projects(clean_text, team_id, channel_id, say, client):
+    say(list_projects(team_id))
+
+
+def _cmd_use_project(clean_text, team_id, channel_id, say, client):
+    if not channel_id:
+        say("I couldn't detect the channel for this request.")
+        return
+    say(set_channel_project(clean_text, team_id, channel_id))
+
+
+def _cmd_status(clean_text, team_id, channel_id, say, client):
+    say(show_channel_status(team_id, channel_id))
+
+
+def _cmd_show_bug_template(clean_text, team_id, channel_id, say, client):
+    say(show_bug_report_template(team_id, channel_id=channel_id))
+
+
+def _cmd_create_bug_report(clean_text, team_id, channel_id, say, client):
+    # Pass channel_id so project-specific configuration is used if set.
+    # Streamed so the user sees the report growing instead of waiting
+    # for the full generation.
+    _stream_bug_report(clean_text, team_id, channel_id, say, client)
+
+
+def _cmd_help(clean_text, team_id, channel_id, say, client):
+    say(get_help())
+
+
+def _cmd_edit_bug_template(clean_text, team_id, channel_id, say, client):
+    payload = strip_command(clean_text, "edit bug template")
+    if len(payload) < MIN_BUG_REPORT_TEMPLATE_LENGTH:
+        say(
+            f"Bug report template is too short. "
+            f"Must be at least {MIN_BUG_REPORT_TEMPLATE_LENGTH} characters."
+        )
+        return
+    say(edit_bug_report_template(clean_text, team_id, channel_id=channel_id))
+
+
+def _cmd_show_project(clean_text, team_id, channel_id, say, client):
+    say(show_project_overview(team_id, channel_id=channel_id))
+
+
+def _cmd_update_docs(clean_text, team_id, channel_id, say, client):
+    payload = strip_command(clean_text, "update docs")
+    if len(payload) < MIN_PROJECT_OVERVIEW_LENGTH:
+        say(
+            f"Project description is too short. "
+            f"Must be at least {MIN_PROJECT_OVERVIEW_LENGTH} characters."
+        )
+        return
+    say(update_project_overview(clean_text, team_id, channel_id=channel_id))
+
+
+def _cmd_enable_docs(clean_text, team_id, channel_id, say, client):
+    set_use_documentation(True, team_id, channel_id=channel_id)
+    say("Bot will use project documentation")
+
+
+def _cmd_disable_docs(clean_text, team_id, channel_id, say, client):
+    set_use_documentation(False, team_id, channel_id=channel_id)
+    say("Bot won't use project documentation")
+
+
+def _cmd_set_jira_token(clean_text, team_id, channel_id, say, client):
+    say(set_jira_token(clean_text, team_id, channel_id=channel_id))
+
+
+def _cmd_set_jira_url(clean_text, team_id, channel_id, say, client):
+    say(set_jira_url(clean_text, team_id, channel_id=channel_id))
+
+
+def _cmd_set_jira_query(clean_text, team_id, channel_id, say, client):
+    say(set_jira_bug_query(clean_text, team_id, channel_id=channel_id))
+
+
+def _cmd_show_jira_query(clean_text, team_id, channel_id, say, client):
+    say(show_jira_bug_query(team_id, channel_id=channel_id))
+
+
+def _cmd_set_jira_email(clean_text, team_id, channel_id, say, client):
+    say(set_jira_email(clean_text, team_id, channel_id=channel_id))
+
+
+def _cmd_set_jira_defaults(clean_text, team_id, channel_id, say, client):
+    say(set_jira_defaults(clean_text, team_id, channel_id=channel_id))
+
+
+def _cmd_show_jira_defaults(clean_text, team_id, channel_id, say, client):
+    say(show_jira_defaults(team_id, channel_id=channel_id))
+
+
+def _cmd_clear_jira_default(clean_text, team_id, channel_id, say, client):
+    say(clear_jira_default(clean_text, team_id, channel_id=channel_id))
+
+
+def _cmd_test_jira(clean_text, team_id, channel_id, say, client):
+    say(test_jira_connection(team_id, channel_id=channel_id))
+
+
+def _cmd_get_bugs(clean_text, team_id, channel_id, say, client):
+    say(get_jira_bugs(team_id, channel_id=channel_id))
+
+
+# Keyword routing table, scanned in priority order. Commands are matched as
+# substrings of the lowercased text (same semantics as the old if-chain), so
+# this stays an ordered tuple rather than a dict keyed by prefix. One loop
+# with C-level `in` checks replaces ~20 contains() calls with per-call list
+# allocations.
+_COMMAND_ROUTES = (
+    ("list projects", _cmd_list_projects),
+    ("use project", _cmd_use_project),
+    ("status", _cmd_status),
+    ("show bug template", _cmd_show_bug_template),
+    ("create bug report", _cmd_create_bug_report),
+    ("help", _cmd_help),
+    ("edit bug template", _cmd_edit_bug_template),
+    ("show project", _cmd_show_project),
+    ("update docs", _cmd_update_docs),
+    ("enable docs", _cmd_enable_docs),
+    ("disable docs", _cmd_disable_docs),
+    ("set jira token", _cmd_set_jira_token),
+    ("set jira url", _cmd_set_jira_url),
+    ("set jira query", _cmd_set_jira_query),
+    ("show jira query", _cmd_show_jira_query),
+    ("set jira email", _cmd_set_jira_email),
+    ("set jira defaults", _cmd_set_jira_defaults),
+    ("show jira defaults", _cmd_show_jira_defaults),
+    ("clear jira default", _cmd_clear_jira_default),
+    ("test jira", _cmd_test_jira),
+    ("get bugs", _cmd_get_bugs),
+)
+
+
 # Main event handler
 @slack_app.event("app_mention")
-def handle_mention(event, say, body):
+def handle_mention(event, say, body, client):
     raw_text = event.get("text", "") or ""
     # Strip leading '<@BOTID>' mention so length checks and commands work on real text.
     clean_text = strip_leading_mention(raw_text)
@@ -69,6 +238,19 @@ def handle_mention(event, say, body):
     team_id = body.get("team_id") or event.get("team", {}).get("id")
     channel_id = event.get("channel")
 
+    # Validate both IDs once at the boundary; command handlers re-sanitize
+    # via the cached fast path, so this is the only scan that does real work
+    try:
+        ids = sanitize_slack_ids(
+            {"team_id": team_id, "channel_id": channel_id},
+            allow_none_for=frozenset({"team_id", "channel_id"}),
+        )
+        team_id, channel_id = ids["team_id"], ids["channel_id"]
+    except ValueError as e:
+        logger.error("Invalid Slack identifiers in event: %s", e)
+        say("Sorry, I couldn't process that request.")
+        return
+
     # Per-channel welcome message on first mention in that channel
     if team_id and channel_id:
         welcome_shown = get_channel_welcome_shown(team_id, channel_id)
@@ -95,136 +277,43 @@ def handle_mention(event, say, body):
         return
 
 
-    # Project configuration selection / discovery
-    if contains(text, ["list projects"]):
-        say(list_projects(team_id))
-        return
-
-    if contains(text, ["use project"]):
-        if not channel_id:
-            say("I couldn't detect the channel for this request.")
-            return
-        say(set_channel_project(clean_text, team_id, channel_id))
-        return
-
-    # Show channel status
-    if contains(text, ["status"]):
-        say(show_channel_status(team_id, channel_id))
-        return
-
-    # Show bug report template
-    if contains(text, ["show bug template"]):
-        say(show_bug_report_template(team_id, channel_id=channel_id))
-        return
-
-    # Generate bug report
-    if contains(text, ["create bug report"]):
-        # Pass channel_id so project-specific configuration is used if set.
-        say(generate_bug_report(clean_text, team_id, channel_id=channel_id))
-        return
-
-    # Help
-    if contains(text, ["help"]):
-        say(get_help())
-        return
-
-    # Edit bug report template
-    if contains(text, ["edit bug template"]):
-        payload = strip_command(clean_text, "edit bug template")
-        if len(payload) < MIN_BUG_REPORT_TEMPLATE_LENGTH:
-            say(
-                f"Bug report template is too short. "
-                f"Must be at least {MIN_BUG_REPORT_TEMPLATE_LENGTH} characters."
-            )
-            return
-        say(edit_bug_report_template(clean_text, team_id, channel_id=channel_id))
-        return
-
-    # Show project overview
-    if contains(text, ["show project"]):
-        say(show_project_overview(team_id, channel_id=channel_id))
-        return
-
-    # Update project overview
-    if contains(text, ["update docs"]):
-        payload = strip_command(clean_text, "update docs")
-        if len(payload) < MIN_PROJECT_OVERVIEW_LENGTH:
-            say(
-                f"Project description is too short. "
-                f"Must be at least {MIN_PROJECT_OVERVIEW_LENGTH} characters."
-            )
+    # Route to the first matching command keyword
+    for keyword, handler in _COMMAND_ROUTES:
+        if keyword in text:
+            handler(clean_text, team_id, channel_id, say, client)
             return
-        say(update_project_overview(clean_text, team_id, channel_id=channel_id))
-        return
 
-    # Use project overview for bug report generation
-    if contains(text, ["enable docs"]):
-        set_use_documentation(True, team_id, channel_id=channel_id)
-        say("Bot will use project documentation")
-        return
-
-    # Ignore project overview for bug report generation
-    if contains(text, ["disable docs"]):
-        set_use_documentation(False, team_id, channel_id=channel_id)
-        say("Bot won't use project documentation")
-        return
-
-    # Set Jira Token
-    if contains(text, ["set jira token"]):
-        say(set_jira_token(clean_text, team_id, channel_id=channel_id))
-        return
-
-    # Set Jira URL
-    if contains(text, ["set jira url"]):
-        say(set_jira_url(clean_text, team_id, channel_id=channel_id))
-        return
-
-    # Set Jira Bug Query
-    if contains(text, ["set jira query"]):
-        say(set_jira_bug_query(clean_text, team_id, channel_id=channel_id))
-        return
-
-    # Show Jira Bug Query
-    if contains(text, ["show jira query"]):
-        say(show_jira_bug_query(team_id, channel_id=channel_id))
-        return
-
-    # Set Jira Email
-    if contains(text, ["set jira email"]):
-        say(set_jira_email(clean_text, team_id, channel_id=channel_id))
-        return
+    # Default fallback
+    logger.warning("Failed to parse: %s", clean_text)
+    if team_id:
+        # Increment unknown commands counter (non-blocking, won't raise exceptions)
+        increment_unknown_commands(team_id)
+    say("I did not understand that command.")
 
-    # Set Jira Defaults
-    if contains(text, ["set jira defaults"]):
-        say(set_jira_defaults(clean_text, team_id, channel_id=channel_id))
-        return
 
-    # Show Jira Defaults
-    if contains(text, ["show jira defaults"]):
-        say(show_jira_defaults(team_id, channel_id=channel_id))
-        return
+def _warm_openai_connection():
+    """
+    Prime the OpenAI HTTP pool so the first bug report doesn't pay the
+    TCP/TLS handshake. Mongo is already warm - bot.db pings it at import.
+    Best-effort: a failure here only means the first request is slower.
+    """
+    from bot.bug_report_commands import client as openai_client
 
-    # Clear Jira Default
-    if contains(text, ["clear jira default"]):
-        say(clear_jira_default(clean_text, team_id, channel_id=channel_id))
+    if openai_client is None:
         return
+    try:
+        openai_client.models.list()
+        logger.debug("OpenAI connection warmed up")
+    except Exception as e:
+        logger.warning("OpenAI warmup failed: %s", e)
 
-    # Test Jira Connection
-    if contains(text, ["test jira"]):
-        say(test_jira_connection(team_id, channel_id=channel_id))
-        return
 
-    # Get Jira Bugs
-    if contains(text, ["get bugs"]):
-        say(get_jira_bugs(team_id, channel_id=channel_id))
-        return
+@fastapi_app.on_event("startup")
+async def _warmup():
+    import asyncio
 
-    # Default fallback
-    logger.warning(f"Failed to parse: {clean_text}")
-    if team_id:
-        # Increment unknown commands counter (non-blocking, won't raise exceptions)
-        increment_unknown_commands(team_id)
-    say("I did not understand that command.")
+    # Fire and forget - don't delay serving the first Slack event.
+    asyncio.get_running_loop().create_task(run_in_threadpool(_warm_openai_connection))
 
 
 @fastapi_app.post("/slack/events")
@@ -2,7 +2,12 @@
 Bug report generation and template management commands.
 """
 import os
+import textwrap
+import threading
+import time
+from typing import Callable
 
+import httpx
 from openai import OpenAI
 from openai import APITimeoutError
 
@@ -12,27 +17,147 @@ from bot.rate_limiter import openai_rate_limiter
 from bot.metrics import increment_openai_requests
 from bot.constants import (
     OPENAI_API_TIMEOUT_SECONDS,
+    OPENAI_HTTP_MAX_CONNECTIONS,
+    OPENAI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    OPENAI_MAX_COMPLETION_TOKENS,
+    OPENAI_MAX_RETRIES,
     OPENAI_TEMPERATURE,
     OPENAI_MODEL,
+    OPENAI_STREAM_UPDATE_INTERVAL_SECONDS,
     MAX_BUG_REPORT_INPUT_LENGTH,
+    MAX_BUG_REPORT_INPUT_TOKENS,
 )
 from bot.project_commands import (
-    _require_project,
+    require_project,
     get_settings,
     _update_settings_field,
 )
 
-# Initialize OpenAI client - assumes OPENAI_API_KEY is validated at startup
+# Initialize OpenAI client - assumes OPENAI_API_KEY is validated at startup.
+# max_retries enables the SDK's built-in exponential backoff, so transient
+# timeouts/5xx/rate-limits are retried instead of surfacing to the user.
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
 
+# One process-wide HTTP connection pool with keep-alive backs all OpenAI
+# calls, so warm requests skip the TCP/TLS handshake.
+_openai_http_client = httpx.Client(
+    limits=httpx.Limits(
+        max_connections=OPENAI_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=OPENAI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    ),
+    timeout=OPENAI_API_TIMEOUT_SECONDS,
+)
 
-def generate_bug_report(text: str, team_id: str, channel_id: str | None = None) -> str:
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
+client = (
+    OpenAI(
+        api_key=OPENAI_API_KEY,
+        max_retries=OPENAI_MAX_RETRIES,
+        http_client=_openai_http_client,
+    )
+    if OPENAI_API_KEY
+    else None
+)
+
+# Bound concurrent OpenAI calls so bursts queue locally instead of being
+# rejected remotely with 429s. Configurable per deployment, defaults to 10.
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "10"))
+_openai_semaphore = threading.BoundedSemaphore(OPENAI_MAX_CONCURRENCY)
+
+# Token encoder cached at import time - initialization is expensive.
+# Optional: if tiktoken isn't available we fall back to the character limit only.
+try:
+    import tiktoken
+
+    _TOKEN_ENCODER = tiktoken.encoding_for_model(OPENAI_MODEL)
+except Exception:
+    _TOKEN_ENCODER = None
+
+# Static instructions go in the system message so the per-call user prompt
+# carries only what varies (context, template, input). Both built once at
+# import time and dedented so we don't send billable leading whitespace.
+_SYSTEM_RULES = textwrap.dedent(
+    """\
+    Convert the user's message into a bug report.
+
+    Rules:
+    - If project context is disabled or empty, ignore it.
+    - Bug name must be short (3–6 words).
+    - Steps must be numbered and reproducible.
+    - Infer details only when logically obvious.
+    - If the user input is too short to create a meaningful bug report, respond with: "Too short for bug report".
+    - Output only the bug report in the template format."""
+)
+
+_PROMPT_TEMPLATE = textwrap.dedent(
+    """\
+    {context}
+
+    Use the following format exactly:
+    {template}
+
+    User input: {text}"""
+)
+
+
+def _stream_completion(prompt: str, on_progress: Callable[[str], None]) -> str:
+    """
+    Stream a chat completion, invoking on_progress with the accumulated text
+    at a throttled interval. Returns the full completion text.
+    Progress callbacks are best-effort - a failing callback never aborts the stream.
+    """
+    with _openai_semaphore:
+        stream = client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": _SYSTEM_RULES},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=OPENAI_TEMPERATURE,
+            max_tokens=OPENAI_MAX_COMPLETION_TOKENS,
+            timeout=OPENAI_API_TIMEOUT_SECONDS,
+            stream=True,
+        )
+        parts: list[str] = []
+        last_update = time.monotonic()
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+            now = time.monotonic()
+            if now - last_update >= OPENAI_STREAM_UPDATE_INTERVAL_SECONDS:
+                last_update = now
+                try:
+                    on_progress("".join(parts))
+                except Exception:
+                    logger.exception("Progress callback failed while streaming bug report")
+    return _stripped("".join(parts))
+
+
+def _stripped(content: str) -> str:
+    """strip() only when needed - avoids copying an already-clean completion."""
+    if content and (content[0].isspace() or content[-1].isspace()):
+        return content.strip()
+    return content
+
+
+@require_project
+def generate_bug_report(
+    text: str,
+    team_id: str,
+    channel_id: str | None = None,
+    on_progress: Callable[[str], None] | None = None,
+) -> str:
+    """
+    Generate a bug report from the user's message.
+
+    If on_progress is provided, the OpenAI response is streamed and the
+    callback is invoked with the partial report at most once per
+    OPENAI_STREAM_UPDATE_INTERVAL_SECONDS, so callers can update a Slack
+    message in place while the report is being generated.
+    """
     if client is None:
         return (
             "Bug report generation is temporarily unavailable: "
@@ -53,6 +178,20 @@ def generate_bug_report(text: str, team_id: str, channel_id: str | None = None)
             f"Please shorten it to under {MAX_BUG_REPORT_INPUT_LENGTH} characters."
         )
 
+    # Characters are a poor proxy for what OpenAI actually limits (tokens) -
+    # dense scripts like CJK can pass the character check but still blow the
+    # context budget. Count tokens up front so we bail before a doomed API call.
+    if _TOKEN_ENCODER is not None:
+        n_tokens = len(_TOKEN_ENCODER.encode(text))
+        if n_tokens > MAX_BUG_REPORT_INPUT_TOKENS:
+            logger.warning(
+                "Bug report input too long (tokens=%s) for team_id=%s", n_tokens, team_id
+            )
+            return (
+                "Your message is too long for bug report generation. "
+                "Please shorten it and try again."
+            )
+
     logger.debug("Creating formatting")
     try:
         settings = get_settings(team_id, channel_id=channel_id)
@@ -63,32 +202,28 @@ def generate_bug_report(text: str, team_id: str, channel_id: str | None = None)
         if settings["use_project_context"] and settings["project_context"].strip()
         else ""
     )
-    prompt = f"""
-    Convert the user's message into a bug report.
-
-    {context_block}
-
-    Use the following format exactly:
-    {settings['bug_report_template']}
-
-    Rules:
-    - If project context is disabled or empty, ignore it.
-    - Bug name must be short (3–6 words).
-    - Steps must be numbered and reproducible.
-    - Infer details only when logically obvious.
-    - If the user input is too short to create a meaningful bug report, respond with: "Too short for bug report".
-    - Output only the bug report in the template format.
-
-    User input: {text}
-    """
+    prompt = _PROMPT_TEMPLATE.format_map({
+        "context": context_block,
+        "template": settings["bug_report_template"],
+        "text": text,
+    })
 
     try:
-        response = client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=OPENAI_TEMPERATURE,
-            timeout=OPENAI_API_TIMEOUT_SECONDS,
-        )
+        if on_progress is None:
+            with _openai_semaphore:
+                response = client.chat.completions.create(
+                    model=OPENAI_MODEL,
+                    messages=[
+                        {"role": "system", "content": _SYSTEM_RULES},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=OPENAI_TEMPERATURE,
+                    max_tokens=OPENAI_MAX_COMPLETION_TOKENS,
+                    timeout=OPENAI_API_TIMEOUT_SECONDS,
+                )
+            content = _stripped(response.choices[0].message.content or "")
+        else:
+            content = _stream_completion(prompt, on_progress)
     except APITimeoutError:
         logger.error(
             "OpenAI API timeout while generating bug report for team_id=%s (timeout=%ss)",
@@ -106,7 +241,6 @@ def generate_bug_report(text: str, team_id: str, channel_id: str | None = None)
             "Please try again in a bit."
         )
 
-    content = (response.choices[0].message.content or "").strip()
     if not content:
         logger.error("OpenAI returned empty content for bug report, team_id=%s", team_id)
         return (
@@ -120,12 +254,8 @@ def generate_bug_report(text: str, team_id: str, channel_id: str | None = None)
     return content
 
 
+@require_project
 def show_bug_report_template(team_id: str, channel_id: str | None = None) -> str:
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
     logger.debug("Show bug report template")
     try:
         settings = get_settings(team_id, channel_id=channel_id)
@@ -134,12 +264,8 @@ def show_bug_report_template(team_id: str, channel_id: str | None = None) -> str
         return get_mongodb_error_message(e, "show_bug_report_template")
 
 
+@require_project
 def edit_bug_report_template(text: str, team_id: str, channel_id: str | None = None) -> str:
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
     logger.debug("Editing bug report template")
     payload = strip_command(text, "edit bug template").strip()
     
@@ -153,12 +279,8 @@ def edit_bug_report_template(text: str, team_id: str, channel_id: str | None = N
         return get_mongodb_error_message(e, "edit_bug_report_template")
 
 
+@require_project
 def show_project_overview(team_id: str, channel_id: str | None = None) -> str:
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
     logger.debug("Show project overview")
     try:
         settings = get_settings(team_id, channel_id=channel_id)
@@ -169,12 +291,8 @@ def show_project_overview(team_id: str, channel_id: str | None = None) -> str:
         return get_mongodb_error_message(e, "show_project_overview")
 
 
+@require_project
 def update_project_overview(text: str, team_id: str, channel_id: str | None = None) -> str:
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
     logger.debug("Updating project overview")
     payload = strip_command(text, "update docs").strip()
     
@@ -188,13 +306,9 @@ def update_project_overview(text: str, team_id: str, channel_id: str | None = No
         return get_mongodb_error_message(e, "update_project_overview")
 
 
+@require_project
 def set_use_documentation(flag: bool, team_id: str, channel_id: str | None = None) -> str:
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
-    logger.debug(f"Use documentation flag: {flag}")
+    logger.debug("Use documentation flag: %s", flag)
     try:
         _update_settings_field(team_id, channel_id, "use_project_context", flag)
         return f"Use documentation: {flag}"
@@ -15,6 +15,7 @@ from bot.project_commands import (
     list_projects,
     get_channel_project_name,
     _require_project,
+    require_project,
     get_channel_welcome_shown,
     set_channel_welcome_shown,
     show_channel_status,
@@ -55,6 +56,7 @@ __all__ = [
     "list_projects",
     "get_channel_project_name",
     "_require_project",
+    "require_project",
     "get_channel_welcome_shown",
     "set_channel_welcome_shown",
     "show_channel_status",
@@ -25,7 +25,7 @@ def validate_environment_variables() -> None:
         value = os.getenv(var_name)
         if not value or not value.strip():
             missing_vars.append(f"  - {var_name}: {description}")
-            logger.error(f"Missing required environment variable: {var_name}")
+            logger.error("Missing required environment variable: %s", var_name)
     
     if missing_vars:
         error_message = (
@@ -39,7 +39,7 @@ def validate_environment_variables() -> None:
     
     # Log rate limiting configuration
     rate_limit_max = int(os.getenv("RATE_LIMIT_OPENAI_MAX", "100"))
-    logger.info(f"OpenAI rate limiting: {rate_limit_max} requests per organization per day")
+    logger.info("OpenAI rate limiting: %s requests per organization per day", rate_limit_max)
     
     logger.info("Environment variable validation completed successfully")
 
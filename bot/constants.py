@@ -4,17 +4,32 @@ Application-wide constants for limits, timeouts, and configuration values.
 
 # OpenAI API Configuration
 OPENAI_API_TIMEOUT_SECONDS = 30.0
+# Retries (with SDK-internal exponential backoff) for transient OpenAI failures
+OPENAI_MAX_RETRIES = 3
+# HTTP connection pool backing the OpenAI client (keep-alive avoids
+# per-request TCP/TLS handshakes)
+OPENAI_HTTP_MAX_CONNECTIONS = 40
+OPENAI_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
 OPENAI_TEMPERATURE = 0.2
 OPENAI_MODEL = "gpt-4o-mini"
+# Minimum delay between Slack chat_update calls while streaming a completion
+OPENAI_STREAM_UPDATE_INTERVAL_SECONDS = 1.0
+# Output cap - bug reports follow a short template, so bound worst-case
+# generation latency and cost
+OPENAI_MAX_COMPLETION_TOKENS = 400
 
 # Input Length Limits
 MAX_BUG_REPORT_INPUT_LENGTH = 1000
+MAX_BUG_REPORT_INPUT_TOKENS = 2000
 MAX_TEXT_LENGTH = 1000
 MIN_TEXT_LENGTH = 3
 MIN_PROJECT_OVERVIEW_LENGTH = 50
 MIN_BUG_REPORT_TEMPLATE_LENGTH = 25
 
 # Jira Configuration
+# (connect, read) split: a dead or misrouted endpoint fails in seconds
+# instead of holding a worker thread for the full read timeout
+JIRA_CONNECT_TIMEOUT_SECONDS = 3
 JIRA_CLIENT_TIMEOUT_SECONDS = 10
 MAX_JIRA_TOKEN_LENGTH = 500
 MIN_JIRA_TOKEN_LENGTH = 10
@@ -35,6 +50,11 @@ HTTP_STATUS_FORBIDDEN = 403
 
 # MongoDB Configuration
 MONGODB_SERVER_SELECTION_TIMEOUT_MS = 5000
+# Connection pool: keep a few sockets open through idle periods so webhook
+# bursts don't all pay connection setup, and recycle truly idle ones
+MONGODB_MAX_POOL_SIZE = 50
+MONGODB_MIN_POOL_SIZE = 5
+MONGODB_MAX_IDLE_TIME_MS = 60000
 
 # Identifier Length Limits
 MAX_SLACK_ID_LENGTH = 256
@@ -3,14 +3,26 @@ from pymongo.errors import ConnectionFailure, ConfigurationError
 import os
 
 from bot.logger import logger
-from bot.constants import MONGODB_SERVER_SELECTION_TIMEOUT_MS
+from bot.constants import (
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+    MONGODB_MAX_POOL_SIZE,
+    MONGODB_MIN_POOL_SIZE,
+    MONGODB_MAX_IDLE_TIME_MS,
+)
 
 try:
     mongo_url = os.environ.get("MONGO_URL")
     if not mongo_url:
         raise ValueError("MONGO_URL environment variable is not set")
     
-    client = MongoClient(mongo_url, serverSelectionTimeoutMS=MONGODB_SERVER_SELECTION_TIMEOUT_MS)
+    client = MongoClient(
+        mongo_url,
+        serverSelectionTimeoutMS=MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        maxPoolSize=MONGODB_MAX_POOL_SIZE,
+        minPoolSize=MONGODB_MIN_POOL_SIZE,
+        maxIdleTimeMS=MONGODB_MAX_IDLE_TIME_MS,
+        retryWrites=True,
+    )
     # Test the connection
     client.admin.command('ping')
     db = client["slackbot"]
@@ -23,6 +35,14 @@ try:
         logger.debug("Rate limits collection index created/verified")
     except Exception as e:
         logger.warning("Could not create index on rate_limits collection: %s", e)
+
+    # Every organizations query filters on team_id; without an index each
+    # lookup is a collection scan that grows with tenant count
+    try:
+        orgs.create_index("team_id", unique=True, background=True)
+        logger.debug("Organizations collection index created/verified")
+    except Exception as e:
+        logger.warning("Could not create index on organizations collection: %s", e)
     
     logger.info("MongoDB connection established successfully")
 except (ConnectionFailure, ConfigurationError, ValueError) as e:
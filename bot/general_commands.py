@@ -1,12 +1,12 @@
 """
 General utility commands like help.
 """
-from bot.logger import logger
+import logging
 
+from bot.logger import logger
 
-def get_help() -> str:
-    logger.debug("Help")
-    return """
+# The help text is static - build it once at import instead of per call.
+_HELP_TEXT = """
     *Available commands:*
     
     *General:*
@@ -44,3 +44,9 @@ def get_help() -> str:
     `test jira` - test Jira connection for current project
     `get bugs` - get list of Jira issues using the configured JQL query
     """
+
+
+def get_help() -> str:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Help")
+    return _HELP_TEXT
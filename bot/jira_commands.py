@@ -1,7 +1,12 @@
 """
 Jira integration commands for configuring and interacting with Jira.
 """
+import hashlib
+import re
+import threading
+import time
 import unicodedata
+from collections import OrderedDict
 
 from jira import JIRA
 from jira.exceptions import JIRAError
@@ -9,6 +14,7 @@ from jira.exceptions import JIRAError
 from bot.logger import logger
 from bot.utils import strip_command, get_mongodb_error_message
 from bot.constants import (
+    JIRA_CONNECT_TIMEOUT_SECONDS,
     JIRA_CLIENT_TIMEOUT_SECONDS,
     MAX_JIRA_TOKEN_LENGTH,
     MIN_JIRA_TOKEN_LENGTH,
@@ -24,45 +30,203 @@ from bot.constants import (
     HTTP_STATUS_FORBIDDEN,
 )
 from bot.project_commands import (
-    _require_project,
+    require_project,
     get_settings,
     _update_settings_field,
+    _update_settings_subfields,
 )
 
 
-def set_jira_token(text: str, team_id: str, channel_id: str | None = None):
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
-    token = strip_command(text, "set jira token").strip()
+# Basic email shape check (local@domain.tld), compiled once at import time
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Accepted URL schemes; match() is implicitly anchored at the start
+_HTTP_PREFIX_RE = re.compile(r"https?://", re.IGNORECASE)
+
+# name=value pairs for 'set jira defaults'; one native finditer pass replaces
+# the split-then-split-each-token loop
+_KV_RE = re.compile(r"([^\s=]+)=(\S+)")
+
+# Single-pass cleanup table for pasted URLs: drop zero-width characters and
+# the BOM, turn non-breaking spaces into regular ones
+_INVISIBLE_STRIP = str.maketrans({
+    '\u200b': None,  # zero-width space
+    '\u200c': None,  # zero-width non-joiner
+    '\u200d': None,  # zero-width joiner
+    '\ufeff': None,  # BOM
+    '\u00a0': ' ',   # non-breaking space
+})
+
+# Bounded LRU pool of authenticated JIRA clients. Building a JIRA instance
+# costs a TLS handshake plus a session-init request; reusing one keeps the
+# underlying requests.Session and its keep-alive connections warm. Keyed by
+# (url, email, token hash) so a credential change naturally misses the pool.
+_JIRA_CLIENT_POOL: OrderedDict[tuple[str, str, str], JIRA] = OrderedDict()
+_JIRA_CLIENT_POOL_MAX = 32
+_jira_client_pool_lock = threading.Lock()
+
+
+def _pooled_jira_client(jira_url: str, jira_email: str, jira_token: str) -> JIRA | None:
+    key = (jira_url, jira_email, hashlib.sha256(jira_token.encode()).hexdigest())
+    with _jira_client_pool_lock:
+        jira = _JIRA_CLIENT_POOL.get(key)
+        if jira is not None:
+            _JIRA_CLIENT_POOL.move_to_end(key)
+        return jira
+
+
+def _pool_jira_client(jira_url: str, jira_email: str, jira_token: str, jira: JIRA) -> None:
+    key = (jira_url, jira_email, hashlib.sha256(jira_token.encode()).hexdigest())
+    with _jira_client_pool_lock:
+        _JIRA_CLIENT_POOL[key] = jira
+        _JIRA_CLIENT_POOL.move_to_end(key)
+        while len(_JIRA_CLIENT_POOL) > _JIRA_CLIENT_POOL_MAX:
+            _JIRA_CLIENT_POOL.popitem(last=False)
+
+
+# Short-lived cache of formatted issue lists, keyed by (team_id, channel_id,
+# JQL digest). Two users typing 'get bugs' in the same channel within seconds
+# otherwise trigger identical Jira searches. Mirrors the settings cache in
+# project_commands; values are immutable strings so no copying is needed.
+_BUG_LIST_CACHE_TTL_SECONDS = 30.0
+_bug_list_cache: dict[tuple[str, str | None, str], tuple[float, str]] = {}
+_bug_list_cache_lock = threading.Lock()
+
+
+def _bug_list_cache_key(team_id: str, channel_id: str | None, jql_query: str) -> tuple:
+    digest = hashlib.blake2b(jql_query.encode(), digest_size=8).hexdigest()
+    return (team_id, channel_id, digest)
+
+
+def _bug_list_cache_get(cache_key: tuple) -> str | None:
+    with _bug_list_cache_lock:
+        entry = _bug_list_cache.get(cache_key)
+        if entry is None:
+            return None
+        cached_at, text = entry
+        if time.monotonic() - cached_at >= _BUG_LIST_CACHE_TTL_SECONDS:
+            del _bug_list_cache[cache_key]
+            return None
+        return text
+
+
+def _bug_list_cache_put(cache_key: tuple, text: str) -> None:
+    with _bug_list_cache_lock:
+        _bug_list_cache[cache_key] = (time.monotonic(), text)
+
+
+def _valid_email(email: str) -> bool:
+    return _EMAIL_RE.fullmatch(email) is not None
+
+
+# Coarse JQL lexer: accepts quoted strings, identifiers (incl. cf[10010]-style
+# custom fields), numbers, operators and whitespace. Rejecting garbage locally
+# (smart quotes, backticks, emoji) saves a wasted Jira round-trip per typo.
+# Possessive quantifiers keep matching linear - no backtracking blowups.
+_JQL_RE = re.compile(
+    r"""(?:
+        "[^"\n]*+"          # double-quoted string
+      | '[^'\n]*+'          # single-quoted string
+      | [A-Za-z_][\w.]*+    # field, function or keyword
+      | \d++                # number
+      | [=<>~!(),\[\]\-*]   # operators and punctuation
+      | \s++                # whitespace
+    )++""",
+    re.VERBOSE,
+)
 
-    if not token:
-        return "Please provide a Jira token. Example: `set jira token <your-token>`"
 
-    if len(token) < MIN_JIRA_TOKEN_LENGTH:
-        return "Jira token looks too short. Please send a valid token."
+def _valid_jql(query: str) -> bool:
+    return _JQL_RE.fullmatch(query) is not None
 
-    if len(token) > MAX_JIRA_TOKEN_LENGTH:
-        return (
+
+# Declarative specs for the strip-command / validate-length / store setters.
+# One shared code path instead of three near-identical functions; per-setter
+# quirks (like email shape) hook in via "validate". set_jira_url stays
+# bespoke because of its Slack-link unwrapping and Unicode cleanup.
+_SETTER_SPECS = {
+    "jira_token": {
+        "command": "set jira token",
+        "min_len": MIN_JIRA_TOKEN_LENGTH,
+        "max_len": MAX_JIRA_TOKEN_LENGTH,
+        "empty_msg": "Please provide a Jira token. Example: `set jira token <your-token>`",
+        "short_msg": "Jira token looks too short. Please send a valid token.",
+        "long_msg": (
             f"Jira token looks unusually long. "
             f"Please ensure it's correct and shorter than {MAX_JIRA_TOKEN_LENGTH} characters."
-        )
+        ),
+        "ok_msg": "Jira token has been updated.",
+    },
+    "jira_bug_query": {
+        "command": "set jira query",
+        "min_len": MIN_JIRA_QUERY_LENGTH,
+        "max_len": MAX_JIRA_QUERY_LENGTH,
+        "empty_msg": (
+            "Please provide a JQL query. "
+            "Example: `set jira query project = PROJ AND status != Done`"
+        ),
+        "short_msg": "Jira query looks too short. Please provide a valid JQL query.",
+        "validate": _valid_jql,
+        "invalid_msg": (
+            "Jira query contains characters that don't look like JQL "
+            "(check for smart quotes or Slack formatting). Please fix it and try again."
+        ),
+        "long_msg": (
+            f"Jira query is too long. "
+            f"Please shorten it to under {MAX_JIRA_QUERY_LENGTH} characters."
+        ),
+        "ok_msg": "Jira bug query has been updated.",
+    },
+    "jira_email": {
+        "command": "set jira email",
+        "max_len": MAX_JIRA_EMAIL_LENGTH,
+        "empty_msg": (
+            "Please provide a Jira email address. "
+            "Example: `set jira email user@example.com`"
+        ),
+        "validate": _valid_email,
+        "invalid_msg": "Please provide a valid email address.",
+        "long_msg": (
+            f"Jira email is too long. "
+            f"Please provide an email shorter than {MAX_JIRA_EMAIL_LENGTH} characters."
+        ),
+        "ok_msg": "Jira email has been updated.",
+    },
+}
+
+
+@require_project
+def _apply_setter(field: str, text: str, team_id: str, channel_id: str | None):
+    """Run the shared validate-and-store flow for a _SETTER_SPECS entry."""
+    spec = _SETTER_SPECS[field]
+    value = strip_command(text, spec["command"]).strip()
+
+    if not value:
+        return spec["empty_msg"]
+
+    if "min_len" in spec and len(value) < spec["min_len"]:
+        return spec["short_msg"]
+
+    if len(value) > spec["max_len"]:
+        return spec["long_msg"]
+
+    validate = spec.get("validate")
+    if validate is not None and not validate(value):
+        return spec["invalid_msg"]
 
     try:
-        _update_settings_field(team_id, channel_id, "jira_token", token)
-        return "Jira token has been updated."
+        _update_settings_field(team_id, channel_id, field, value)
+        return spec["ok_msg"]
     except Exception as e:
-        return get_mongodb_error_message(e, "set_jira_token")
+        return get_mongodb_error_message(e, f"set_{field}")
+
 
+def set_jira_token(text: str, team_id: str, channel_id: str | None = None):
+    return _apply_setter("jira_token", text, team_id, channel_id)
 
+
+@require_project
 def set_jira_url(text: str, team_id: str, channel_id: str | None = None):
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
     url = strip_command(text, "set jira url")
     
     # Remove Slack link formatting if present (e.g., <https://...|text>)
@@ -73,22 +237,21 @@ def set_jira_url(text: str, team_id: str, channel_id: str | None = None):
         else:
             url = url[1:-1]
     
-    # Clean the URL: normalize Unicode and strip whitespace
-    url = unicodedata.normalize('NFKC', url)
-    # Remove zero-width and other problematic invisible characters
-    url = url.replace('\u200b', '').replace('\u200c', '').replace('\u200d', '').replace('\ufeff', '')
-    # Replace non-breaking spaces with regular spaces, then strip once
-    url = url.replace('\u00a0', ' ').strip()
+    # Clean the URL: normalize Unicode, then drop invisible characters in a
+    # single translate pass. Both steps only matter for non-ASCII input, and
+    # isascii() is a tight early-exit C loop - the common all-ASCII URL skips
+    # the UCD table lookups entirely.
+    if not url.isascii():
+        url = unicodedata.normalize('NFKC', url).translate(_INVISIBLE_STRIP)
+    url = url.strip()
 
     if not url:
         return "Please provide a Jira URL. Example: `set jira url https://your-instance.atlassian.net`"
 
-    # Check if URL starts with http:// or https:// (case-insensitive)
-    url_lower = url.lower()
-    starts_with_http = url_lower.startswith("http://")
-    starts_with_https = url_lower.startswith("https://")
-    
-    if not (starts_with_http or starts_with_https):
+    # Check if URL starts with http:// or https:// (case-insensitive).
+    # An anchored match only inspects the first few characters, where
+    # lower().startswith() would copy the whole URL first.
+    if _HTTP_PREFIX_RE.match(url) is None:
         logger.error(
             f"URL validation failed. Input: {repr(text)}, Extracted: {repr(url)}, "
             f"Length: {len(url)}, First char code: {ord(url[0]) if url else 'N/A'}, "
@@ -110,66 +273,15 @@ def set_jira_url(text: str, team_id: str, channel_id: str | None = None):
 
 
 def set_jira_bug_query(text: str, team_id: str, channel_id: str | None = None):
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
-    query = strip_command(text, "set jira query").strip()
-
-    if not query:
-        return "Please provide a JQL query. Example: `set jira query project = PROJ AND status != Done`"
-
-    if len(query) < MIN_JIRA_QUERY_LENGTH:
-        return "Jira query looks too short. Please provide a valid JQL query."
-
-    if len(query) > MAX_JIRA_QUERY_LENGTH:
-        return (
-            f"Jira query is too long. "
-            f"Please shorten it to under {MAX_JIRA_QUERY_LENGTH} characters."
-        )
-
-    try:
-        _update_settings_field(team_id, channel_id, "jira_bug_query", query)
-        return "Jira bug query has been updated."
-    except Exception as e:
-        return get_mongodb_error_message(e, "set_jira_bug_query")
+    return _apply_setter("jira_bug_query", text, team_id, channel_id)
 
 
 def set_jira_email(text: str, team_id: str, channel_id: str | None = None):
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
-    email = strip_command(text, "set jira email").strip()
-
-    if not email:
-        return "Please provide a Jira email address. Example: `set jira email user@example.com`"
-
-    # Basic email validation
-    if "@" not in email or "." not in email.split("@")[-1]:
-        return "Please provide a valid email address."
-
-    if len(email) > MAX_JIRA_EMAIL_LENGTH:
-        return (
-            f"Jira email is too long. "
-            f"Please provide an email shorter than {MAX_JIRA_EMAIL_LENGTH} characters."
-        )
-
-    try:
-        _update_settings_field(team_id, channel_id, "jira_email", email)
-        return "Jira email has been updated."
-    except Exception as e:
-        return get_mongodb_error_message(e, "set_jira_email")
+    return _apply_setter("jira_email", text, team_id, channel_id)
 
 
+@require_project
 def show_jira_bug_query(team_id: str, channel_id: str | None = None):
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
     # Reuse get_settings so project-specific settings are applied if channel/project is set.
     try:
         settings = get_settings(team_id, channel_id=channel_id)
@@ -183,6 +295,7 @@ def show_jira_bug_query(team_id: str, channel_id: str | None = None):
         return get_mongodb_error_message(e, "show_jira_bug_query")
 
 
+@require_project
 def set_jira_defaults(text: str, team_id: str, channel_id: str | None = None) -> str:
     """
     Set Jira default field values.
@@ -190,11 +303,6 @@ def set_jira_defaults(text: str, team_id: str, channel_id: str | None = None) ->
     - Single: set jira defaults project=PROJ-123
     - Multiple: set jira defaults project=PROJ-123 type=Bug priority=High
     """
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
     payload = strip_command(text, "set jira defaults").strip()
     
     if not payload:
@@ -204,36 +312,30 @@ def set_jira_defaults(text: str, team_id: str, channel_id: str | None = None) ->
             "For a single field: `set jira defaults project=PROJ-123`"
         )
     
-    # Parse field=value pairs
-    pairs = payload.split()
+    # Parse field=value pairs with a single regex pass; anything the pattern
+    # doesn't consume (no '=', empty name or value) is reported as malformed
     defaults = {}
     errors = []
-    
-    for pair in pairs:
-        if '=' not in pair:
-            errors.append(f"Invalid format: '{pair}' (expected field=value)")
-            continue
-        
-        field_name, field_value = pair.split('=', 1)
-        field_name = field_name.strip()
-        field_value = field_value.strip()
-        
-        if not field_name:
-            errors.append(f"Empty field name in: '{pair}'")
-            continue
-        
-        if not field_value:
-            errors.append(f"Empty field value in: '{pair}'")
+
+    for leftover in _KV_RE.sub("", payload).split():
+        errors.append(f"Invalid format: '{leftover}' (expected field=value)")
+
+    for match in _KV_RE.finditer(payload):
+        field_name, field_value = match.group(1), match.group(2)
+
+        # Field names become Mongo dotted-path components now
+        if "." in field_name or field_name.startswith("$"):
+            errors.append(f"Invalid field name: '{field_name}' (must not contain '.' or start with '$')")
             continue
-        
+
         if len(field_name) > MAX_JIRA_FIELD_NAME_LENGTH:
             errors.append(f"Field name too long: '{field_name}' (max {MAX_JIRA_FIELD_NAME_LENGTH} characters)")
             continue
-        
+
         if len(field_value) > MAX_JIRA_FIELD_VALUE_LENGTH:
             errors.append(f"Field value too long: '{field_value}' (max {MAX_JIRA_FIELD_VALUE_LENGTH} characters)")
             continue
-        
+
         defaults[field_name] = field_value
     
     if errors:
@@ -243,29 +345,23 @@ def set_jira_defaults(text: str, team_id: str, channel_id: str | None = None) ->
         return "No valid field=value pairs found."
     
     try:
-        # Get current defaults and merge
-        settings = get_settings(team_id, channel_id=channel_id)
-        current_defaults = settings.get("jira_defaults", {})
-        current_defaults.update(defaults)
-        
-        # Save back to settings
-        _update_settings_field(team_id, channel_id, "jira_defaults", current_defaults)
-        
+        # Per-key $set merge server-side - only the changed keys are written,
+        # not the whole jira_defaults subdocument
+        _update_settings_subfields(
+            team_id, channel_id, "jira_defaults", updates=defaults
+        )
+
         fields_list = ", ".join(f"*{k}*={v}" for k, v in defaults.items())
         return f"Jira defaults updated: {fields_list}."
     except Exception as e:
         return get_mongodb_error_message(e, "set_jira_defaults")
 
 
+@require_project
 def show_jira_defaults(team_id: str, channel_id: str | None = None) -> str:
     """
     Show all Jira default field values.
     """
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
     try:
         settings = get_settings(team_id, channel_id=channel_id)
         defaults = settings.get("jira_defaults", {})
@@ -286,17 +382,13 @@ def show_jira_defaults(team_id: str, channel_id: str | None = None) -> str:
         return get_mongodb_error_message(e, "show_jira_defaults")
 
 
+@require_project
 def clear_jira_default(text: str, team_id: str, channel_id: str | None = None) -> str:
     """
     Clear a specific Jira default field value.
     Syntax: clear jira default <field>
     Example: clear jira default project
     """
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
     field_name = strip_command(text, "clear jira default").strip()
     
     if not field_name:
@@ -309,30 +401,31 @@ def clear_jira_default(text: str, team_id: str, channel_id: str | None = None) -
         return f"Field name is too long (max {MAX_JIRA_FIELD_NAME_LENGTH} characters)."
     
     try:
-        # Get current defaults
+        # Existence check for the user-facing message (served from cache)
         settings = get_settings(team_id, channel_id=channel_id)
         defaults = settings.get("jira_defaults", {})
-        
+
         if field_name not in defaults:
             return f"Jira default field *{field_name}* is not set."
-        
-        # Remove the field
-        del defaults[field_name]
-        
-        # Save back to settings (empty dict if no defaults left)
-        _update_settings_field(team_id, channel_id, "jira_defaults", defaults)
-        
+
+        # Per-key $unset - no rewrite of the remaining defaults
+        _update_settings_subfields(
+            team_id, channel_id, "jira_defaults", removals=(field_name,)
+        )
+
         return f"Jira default field *{field_name}* has been cleared."
     except Exception as e:
         return get_mongodb_error_message(e, "clear_jira_default")
 
 
-def _get_jira_client(team_id: str, channel_id: str | None = None) -> tuple[JIRA | None, str]:
+def _get_jira_client(team_id: str, channel_id: str | None = None) -> tuple[JIRA | None, dict, str]:
     """
     Get a Jira client instance for the current project settings.
-    Returns (JIRA client, error_message).
+    Returns (JIRA client, settings, error_message) - the resolved settings
+    are returned so callers don't have to fetch them a second time.
     If error_message is not empty, client will be None.
     """
+    settings = {}
     try:
         settings = get_settings(team_id, channel_id=channel_id)
         
@@ -351,7 +444,7 @@ def _get_jira_client(team_id: str, channel_id: str | None = None) -> tuple[JIRA
         
         if missing:
             missing_str = ", ".join(missing)
-            return None, (
+            return None, settings, (
                 f"Jira is not fully configured. Missing: {missing_str}.\n"
                 f"Please set these using:\n"
                 f"- `set jira url <url>`\n"
@@ -359,40 +452,47 @@ def _get_jira_client(team_id: str, channel_id: str | None = None) -> tuple[JIRA
                 f"- `set jira email <email>`"
             )
         
+        # Reuse a pooled client when these exact credentials connected before
+        jira = _pooled_jira_client(jira_url, jira_email, jira_token)
+        if jira is not None:
+            return jira, settings, ""
+
         # Create Jira client with basic auth (email + API token)
         try:
             jira = JIRA(
                 options={'server': jira_url, 'rest_api_version': '3'},
                 basic_auth=(jira_email, jira_token),
-                timeout=JIRA_CLIENT_TIMEOUT_SECONDS,
+                # requests-style (connect, read) pair, passed through to the
+                # underlying session on every call
+                timeout=(JIRA_CONNECT_TIMEOUT_SECONDS, JIRA_CLIENT_TIMEOUT_SECONDS),
+                # Skip the /serverInfo probe on construction; the first real
+                # request surfaces auth/connectivity errors just as well
+                get_server_info=False,
             )
-            return jira, ""
+            _pool_jira_client(jira_url, jira_email, jira_token, jira)
+            return jira, settings, ""
         except JIRAError as e:
             logger.exception("Jira connection error for team_id=%s", team_id)
             if e.status_code == HTTP_STATUS_UNAUTHORIZED:
-                return None, "Authentication failed. Please check your Jira email and token."
+                return None, settings, "Authentication failed. Please check your Jira email and token."
             elif e.status_code == HTTP_STATUS_FORBIDDEN:
-                return None, "Access forbidden. Please check your Jira permissions."
+                return None, settings, "Access forbidden. Please check your Jira permissions."
             else:
-                return None, f"Failed to connect to Jira: {e.text or str(e)}"
+                return None, settings, f"Failed to connect to Jira: {e.text or str(e)}"
         except Exception as e:
             logger.exception("Unexpected error creating Jira client for team_id=%s", team_id)
-            return None, f"Failed to connect to Jira: {str(e)}"
+            return None, settings, f"Failed to connect to Jira: {str(e)}"
     except Exception as e:
-        return None, get_mongodb_error_message(e, "get_jira_client")
+        return None, settings, get_mongodb_error_message(e, "get_jira_client")
 
 
+@require_project
 def test_jira_connection(team_id: str, channel_id: str | None = None) -> str:
     """
     Test the Jira connection for the current project.
     """
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
     try:
-        jira, error_msg = _get_jira_client(team_id, channel_id)
+        jira, _settings, error_msg = _get_jira_client(team_id, channel_id)
         
         if error_msg:
             return error_msg
@@ -416,23 +516,19 @@ def test_jira_connection(team_id: str, channel_id: str | None = None) -> str:
         return get_mongodb_error_message(e, "test_jira_connection")
 
 
+@require_project
 def get_jira_bugs(team_id: str, channel_id: str | None = None) -> str:
     """
     Get list of Jira issues according to the JQL query specified in the current project.
     """
-    # Check if project is required
-    error_msg = _require_project(team_id, channel_id)
-    if error_msg:
-        return error_msg
-    
     try:
-        jira, error_msg = _get_jira_client(team_id, channel_id)
+        # Settings come back alongside the client, so no second
+        # get_settings round-trip is needed here
+        jira, settings, error_msg = _get_jira_client(team_id, channel_id)
         
         if error_msg:
             return error_msg
         
-        # Get JQL query from project settings
-        settings = get_settings(team_id, channel_id=channel_id)
         jql_query = settings.get("jira_bug_query", "").strip()
         
         if not jql_query:
@@ -442,37 +538,55 @@ def get_jira_bugs(team_id: str, channel_id: str | None = None) -> str:
                 "Example: `set jira query project = PROJ AND status != Done`"
             )
         
+        # Serve a recent identical search from cache before hitting Jira
+        cache_key = _bug_list_cache_key(team_id, channel_id, jql_query)
+        cached = _bug_list_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         # Fetch issues using JQL
         try:
-            # Limit to avoid overwhelming the response
-            issues = jira.search_issues(jql_query, maxResults=MAX_JIRA_ISSUES_LIMIT)
-            
+            # Limit to avoid overwhelming the response; only request the
+            # fields rendered below - the default payload includes every
+            # custom field and weighs 5-20 KB per issue
+            # json_result=True returns the raw response dict and skips the
+            # library's per-issue Resource hydration (and its __getattr__
+            # proxying on every field access below)
+            raw = jira.search_issues(
+                jql_query,
+                maxResults=MAX_JIRA_ISSUES_LIMIT,
+                fields="summary,status,issuetype",
+                json_result=True,
+            )
+            issues = (raw or {}).get("issues") or []
+
             if not issues:
                 return f"No issues found matching the query:\n```{jql_query}```"
-            
-            # Format issues for display
+
+            # Format issues for display - one f-string block per issue
+            # instead of four list appends, and the base URL cleanup hoisted
+            # out of the loop
+            # strip() then rstrip() is intentional; the full /browse/ prefix
+            # is prebuilt so the loop does one concat per issue
+            browse_prefix = settings.get("jira_url", "").strip().rstrip('/') + "/browse/"
             lines = [f"Found *{len(issues)}* issue(s) (showing up to {MAX_JIRA_ISSUES_LIMIT}):\n"]
-            
+
             for issue in issues:
-                # Get key fields
-                key = issue.key
-                summary = issue.fields.summary
-                status = issue.fields.status.name
-                issue_type = issue.fields.issuetype.name
-                
-                # Build issue URL
-                jira_url = settings.get("jira_url", "").strip().rstrip('/')  # strip() then rstrip() is intentional
-                issue_url = f"{jira_url}/browse/{key}"
-                
-                lines.append(f"• *{key}*: {summary}")
-                lines.append(f"  Type: {issue_type} | Status: {status}")
-                lines.append(f"  <{issue_url}|View in Jira>")
-                lines.append("")  # Empty line between issues
+                key = issue["key"]
+                fields = issue["fields"]
+                lines.append(
+                    f"• *{key}*: {fields['summary']}\n"
+                    f"  Type: {fields['issuetype']['name']} | Status: {fields['status']['name']}\n"
+                    f"  <{browse_prefix + key}|View in Jira>\n"
+                )
             
             if len(issues) == MAX_JIRA_ISSUES_LIMIT:
                 lines.append(f"\n_Note: Showing first {MAX_JIRA_ISSUES_LIMIT} issues. There may be more._")
-            
-            return "\n".join(lines)
+
+            result = "\n".join(lines)
+            # Only successful listings are cached; errors always retry
+            _bug_list_cache_put(cache_key, result)
+            return result
         except JIRAError as e:
             logger.exception("Jira API error fetching bugs for team_id=%s", team_id)
             if e.status_code == HTTP_STATUS_BAD_REQUEST:
@@ -1,10 +1,14 @@
 import logging
+import os
 import sys
 
 # Configure logging to write to stderr (unbuffered, better for containers)
-# Railway captures both stdout and stderr, but stderr is unbuffered by default
+# Railway captures both stdout and stderr, but stderr is unbuffered by default.
+# Level comes from the environment so production can run at INFO - at DEBUG
+# every record on the request path pays timestamp and %-formatting costs even
+# when nobody reads it.
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     handlers=[logging.StreamHandler(sys.stderr)]  # Changed to stderr for unbuffered output
 )
@@ -1,9 +1,71 @@
+import atexit
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime
 
+from pymongo import ReturnDocument, UpdateOne
+
 from .db import orgs
 from .utils import sanitize_slack_id, get_mongodb_error_message
 from .logger import logger
 
+
+# Metric timestamps only need second precision, so memoize the formatted
+# string per wall-clock second instead of building a datetime + isoformat
+# on every upsert. The unguarded read/write race is benign: worst case two
+# threads format the same second twice.
+_iso_now_memo: tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    global _iso_now_memo
+    sec = int(time.time())
+    memo_sec, memo_value = _iso_now_memo
+    if sec != memo_sec:
+        memo_value = datetime.utcfromtimestamp(sec).isoformat() + "Z"
+        _iso_now_memo = (sec, memo_value)
+    return memo_value
+
+
+# Invocation increments are buffered in-process and flushed as one
+# bulk_write, so an event burst costs a dict update per event instead of a
+# network write. Metrics are non-critical (see the except blocks below), so
+# the up-to-one-second lag and the small loss window on hard crash are
+# acceptable; atexit covers normal shutdown.
+_INVOCATION_FLUSH_INTERVAL_SECONDS = 1.0
+_pending_invocations: defaultdict[str, int] = defaultdict(int)
+_pending_lock = threading.Lock()
+_flush_timer: threading.Timer | None = None
+
+
+def _flush_pending_invocations():
+    global _flush_timer
+    with _pending_lock:
+        pending = dict(_pending_invocations)
+        _pending_invocations.clear()
+        _flush_timer = None
+    if not pending:
+        return
+    try:
+        orgs.bulk_write(
+            [
+                UpdateOne(
+                    {"team_id": team_id},
+                    {"$inc": {"bot_invocations_total": count}},
+                    upsert=True,
+                )
+                for team_id, count in pending.items()
+            ],
+            ordered=False,
+        )
+    except Exception as e:
+        logger.exception("Error flushing bot invocation metrics: %s", e)
+        # Don't raise - metrics are non-critical
+
+
+atexit.register(_flush_pending_invocations)
+
 def init_or_get_org(team_id: str) -> dict:
     """
     Get organization record from DB. If it doesn't exist, create it.
@@ -11,38 +73,23 @@ def init_or_get_org(team_id: str) -> dict:
     # Sanitize input to prevent MongoDB injection
     team_id = sanitize_slack_id(team_id, "team_id")
     try:
-        org = orgs.find_one({"team_id": team_id})
-        if not org:
-            # Create new org with initial metrics and joined_date (as ISO string)
-            joined_date_str = datetime.utcnow().isoformat() + "Z"
-            org = {
-                "team_id": team_id,
-                "bot_invocations_total": 0,
-                "openai_requests_total": 0,
-                "unknown_commands": 0,
-                "joined_date": joined_date_str,
-            }
-            orgs.insert_one(org)
-            return org
-
-        # Backfill joined_date for existing orgs (convert to string if needed)
-        if "joined_date" not in org:
-            joined_date_str = datetime.utcnow().isoformat() + "Z"
-            orgs.update_one(
-                {"team_id": team_id},
-                {"$set": {"joined_date": joined_date_str}},
-            )
-            org["joined_date"] = joined_date_str
-        elif isinstance(org.get("joined_date"), datetime):
-            # Convert existing datetime to ISO string
-            joined_date_str = org["joined_date"].isoformat() + "Z"
-            orgs.update_one(
-                {"team_id": team_id},
-                {"$set": {"joined_date": joined_date_str}},
-            )
-            org["joined_date"] = joined_date_str
-
-        return org
+        # Single round-trip: $setOnInsert seeds the record on first contact
+        # and is a no-op for existing orgs. Legacy joined_date formats are
+        # handled by migrations.migrate_joined_date, not per-request backfill.
+        return orgs.find_one_and_update(
+            {"team_id": team_id},
+            {
+                "$setOnInsert": {
+                    "team_id": team_id,
+                    "bot_invocations_total": 0,
+                    "openai_requests_total": 0,
+                    "unknown_commands": 0,
+                    "joined_date": _iso_now(),
+                }
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
     except Exception as e:
         logger.exception("Error in init_or_get_org for team_id=%s: %s", team_id, e)
         # Return a minimal org dict to prevent crashes
@@ -51,25 +98,56 @@ def init_or_get_org(team_id: str) -> dict:
             "bot_invocations_total": 0,
             "openai_requests_total": 0,
             "unknown_commands": 0,
-            "joined_date": datetime.utcnow().isoformat() + "Z",
+            "joined_date": _iso_now(),
         }
 
 def increment_bot_invocations(team_id: str):
     """
     Increment bot invocation counter for this org.
+
+    Buffered: the write is batched into the next bulk flush rather than
+    issued immediately.
+    """
+    global _flush_timer
+    # Sanitize input to prevent MongoDB injection
+    team_id = sanitize_slack_id(team_id, "team_id")
+    with _pending_lock:
+        _pending_invocations[team_id] += 1
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(
+                _INVOCATION_FLUSH_INTERVAL_SECONDS, _flush_pending_invocations
+            )
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+def increment_and_get_bot_invocations(team_id: str) -> int:
+    """
+    Atomically increment the bot invocation counter and return the new total
+    in a single round-trip. Use this instead of increment + get when the
+    caller needs the updated count.
     """
     # Sanitize input to prevent MongoDB injection
     team_id = sanitize_slack_id(team_id, "team_id")
     try:
-        # Atomically increment counter
-        orgs.update_one(
+        doc = orgs.find_one_and_update(
             {"team_id": team_id},
-            {"$inc": {"bot_invocations_total": 1}},
-            upsert=True  # ensures record exists even if first call
+            {
+                "$inc": {"bot_invocations_total": 1},
+                "$setOnInsert": {
+                    "team_id": team_id,
+                    "openai_requests_total": 0,
+                    "unknown_commands": 0,
+                    "joined_date": _iso_now(),
+                },
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+            projection={"bot_invocations_total": 1},
         )
+        return doc.get("bot_invocations_total", 0)
     except Exception as e:
         logger.exception("Error incrementing bot invocations for team_id=%s: %s", team_id, e)
-        # Don't raise - metrics are non-critical
+        return 0  # Metrics are non-critical
 
 def get_bot_invocations(team_id: str) -> int:
     """
@@ -0,0 +1,80 @@
+"""
+One-shot data migrations for the organizations collection.
+
+Each migration is idempotent - it only touches documents still in the legacy
+format, so running it multiple times is safe. Run from the repo root with:
+    python -m bot.migrations
+"""
+from datetime import datetime, timezone
+
+from pymongo import UpdateOne
+
+from bot.db import orgs
+from bot.logger import logger
+
+
+def migrate_channel_projects(batch_size: int = 1000) -> int:
+    """
+    Rewrite legacy string channel bindings (channel_id -> project_name) to
+    the dict form (channel_id -> {"project": project_name}).
+
+    Returns the number of organizations updated.
+    """
+    updated = 0
+    ops = []
+    for org in orgs.find({"channel_projects": {"$exists": True}}, {"channel_projects": 1}):
+        sets = {
+            f"channel_projects.{channel_id}": {"project": info}
+            for channel_id, info in (org.get("channel_projects") or {}).items()
+            if isinstance(info, str)
+        }
+        if sets:
+            ops.append(UpdateOne({"_id": org["_id"]}, {"$set": sets}))
+        if len(ops) >= batch_size:
+            orgs.bulk_write(ops, ordered=False)
+            updated += len(ops)
+            ops = []
+    if ops:
+        orgs.bulk_write(ops, ordered=False)
+        updated += len(ops)
+    logger.info("migrate_channel_projects: updated %s organization(s)", updated)
+    return updated
+
+
+def migrate_joined_date(batch_size: int = 1000) -> int:
+    """
+    Convert legacy BSON-date joined_date values to the ISO-8601 string format
+    the application stores, and backfill documents missing the field.
+
+    Returns the number of organizations updated.
+    """
+    now_iso = datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+    updated = 0
+    ops = []
+    query = {
+        "$or": [
+            {"joined_date": {"$type": "date"}},
+            {"joined_date": {"$exists": False}},
+        ]
+    }
+    for org in orgs.find(query, {"joined_date": 1}):
+        joined_date = org.get("joined_date")
+        if isinstance(joined_date, datetime):
+            value = joined_date.isoformat() + "Z"
+        else:
+            value = now_iso
+        ops.append(UpdateOne({"_id": org["_id"]}, {"$set": {"joined_date": value}}))
+        if len(ops) >= batch_size:
+            orgs.bulk_write(ops, ordered=False)
+            updated += len(ops)
+            ops = []
+    if ops:
+        orgs.bulk_write(ops, ordered=False)
+        updated += len(ops)
+    logger.info("migrate_joined_date: updated %s organization(s)", updated)
+    return updated
+
+
+if __name__ == "__main__":
+    migrate_channel_projects()
+    migrate_joined_date()
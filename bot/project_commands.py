@@ -2,7 +2,15 @@
 Project and settings management commands.
 Core functions for managing projects, channels, and settings.
 """
-from datetime import datetime
+import copy
+import functools
+import inspect
+import threading
+import time
+from datetime import datetime, timezone
+from types import MappingProxyType
+
+from pymongo import ReturnDocument
 
 from bot.db import orgs
 from bot.logger import logger
@@ -13,21 +21,84 @@ from bot.utils import (
     get_mongodb_error_message,
 )
 
+_UTC = timezone.utc
+
+_DEFAULT_BUG_REPORT_TEMPLATE = """
+Bug name:
+Steps:
+Actual result:
+Expected:
+"""
+
+# Read-only defaults shared by every get_settings call. Allocated once at
+# import; copy before returning so callers can't mutate the shared mapping.
+_PROJECT_DEFAULTS = MappingProxyType({
+    "use_project_context": False,
+    "project_context": "",
+    "bug_report_template": _DEFAULT_BUG_REPORT_TEMPLATE,
+})
+
+
+# Short-lived in-process cache for get_settings, keyed by (team_id, channel_id).
+# Read-only commands (show template, status, ...) otherwise pay the full Mongo
+# round-trip on every invocation. Writers invalidate the whole team's entries,
+# since project settings are shared across channels.
+_SETTINGS_CACHE_TTL_SECONDS = 30.0
+_settings_cache: dict[tuple[str, str | None], tuple[float, dict]] = {}
+_settings_cache_lock = threading.Lock()
+
+
+def _settings_cache_get(cache_key: tuple[str, str | None]) -> dict | None:
+    with _settings_cache_lock:
+        entry = _settings_cache.get(cache_key)
+        if entry is None:
+            return None
+        cached_at, value = entry
+        if time.monotonic() - cached_at >= _SETTINGS_CACHE_TTL_SECONDS:
+            del _settings_cache[cache_key]
+            return None
+        # Deep copy so callers can't mutate the cached value through the result.
+        return copy.deepcopy(value)
+
+
+def _settings_cache_put(cache_key: tuple[str, str | None], value: dict) -> None:
+    with _settings_cache_lock:
+        _settings_cache[cache_key] = (time.monotonic(), copy.deepcopy(value))
+
+
+def _invalidate_settings_cache(team_id: str) -> None:
+    with _settings_cache_lock:
+        for cache_key in [k for k in _settings_cache if k[0] == team_id]:
+            del _settings_cache[cache_key]
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO-8601 string with trailing Z (the stored format)."""
+    return datetime.now(_UTC).replace(tzinfo=None).isoformat() + "Z"
+
+
+def _resolve_project(channel_info) -> str | None:
+    """
+    Resolve the raw project name from a channel_projects entry.
+    Handles both old format (channel_id -> project_name) and new format
+    (channel_id -> {project: name}); the legacy branch can be dropped once
+    migrations.migrate_channel_projects has run everywhere.
+    """
+    return channel_info.get("project") if isinstance(channel_info, dict) else channel_info
+
 
 def _extract_and_sanitize_project_name(channel_info) -> str | None:
     """
     Extract and sanitize project name from channel_info.
-    Handles both old format (channel_id -> project_name) and new format (channel_id -> {project: name}).
-    
+
     Args:
         channel_info: The channel info from channel_projects dict (can be str or dict)
-        
+
     Returns:
         Sanitized project name, or None if invalid/not found
     """
-    # Handle both old format (channel_id -> project_name) and new format (channel_id -> {project: name})
-    project_name = channel_info.get("project") if isinstance(channel_info, dict) else channel_info
-    
+    project_name = _resolve_project(channel_info)
+
     if not project_name:
         return None
     
@@ -51,80 +122,39 @@ def get_settings(team_id: str, channel_id: str | None = None):
     team_id = sanitize_slack_id(team_id, "team_id")
     if channel_id is not None:
         channel_id = sanitize_slack_id(channel_id, "channel_id", allow_none=False)
-    
-    PROJECT_DEFAULTS = {
-        "use_project_context": False,
-        "project_context": "",
-        "bug_report_template": """
-Bug name:
-Steps:
-Actual result:
-Expected:
-"""
-    }
 
-    try:
-        # Optimized: Combine multiple updates into fewer operations
-        # First, ensure org exists and has required fields
-        joined_date_str = datetime.utcnow().isoformat() + "Z"
-        
-        # Single update to ensure org exists with all required fields
-        # $setOnInsert only sets these fields if document is being created
-        orgs.update_one(
-            {"team_id": team_id},
-            {
-                "$setOnInsert": {
-                    "team_id": team_id,
-                    "channel_projects": {},
-                    "joined_date": joined_date_str,
-                }
-            },
-            upsert=True,
-        )
-        
-        # Fetch org once to check current state
-        org = orgs.find_one({"team_id": team_id})
-        
-        # Handle all updates in a single operation if needed
-        if org:
-            needs_update = False
-            update_fields = {}
-            
-            # Ensure channel_projects exists (only if missing)
-            if "channel_projects" not in org:
-                update_fields["channel_projects"] = {}
-                needs_update = True
-            
-            # Check if joined_date needs conversion or backfill
-            joined_date = org.get("joined_date")
-            if not joined_date:
-                # Backfill missing joined_date
-                update_fields["joined_date"] = joined_date_str
-                needs_update = True
-            elif isinstance(joined_date, datetime):
-                # Convert datetime to ISO string
-                update_fields["joined_date"] = joined_date.isoformat() + "Z"
-                needs_update = True
-            
-            # Perform single update if needed
-            if needs_update:
-                orgs.update_one(
-                    {"team_id": team_id},
-                    {"$set": update_fields},
-                )
-                # Update local org dict to avoid refetch
-                org.update(update_fields)
-    except Exception as e:
-        # Let exception propagate - calling functions will handle it
-        raise
+    cache_key = (team_id, channel_id)
+    cached = _settings_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Single round-trip: create the org with required fields if missing
+    # ($setOnInsert only applies on insert) and return the resulting
+    # document, instead of a separate upsert followed by a find_one.
+    # Legacy joined_date formats are handled by migrations.migrate_joined_date,
+    # not per-request backfill.
+    org = orgs.find_one_and_update(
+        {"team_id": team_id},
+        {
+            "$setOnInsert": {
+                "team_id": team_id,
+                "channel_projects": {},
+                "joined_date": _utcnow_iso(),
+            }
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+        projection={"channel_projects": 1, "projects": 1},
+    )
     if not org:
         # Should not happen after upsert, but handle gracefully
         if channel_id is None:
             return {}
-        return PROJECT_DEFAULTS
+        return dict(_PROJECT_DEFAULTS)
 
     # If no channel context → return empty dict
     if channel_id is None:
+        _settings_cache_put(cache_key, {})
         return {}
 
     channel_projects = org.get("channel_projects") or {}
@@ -135,27 +165,32 @@ Expected:
 
     # If this channel is not yet bound to a specific project, return defaults
     if not project_name:
-        return PROJECT_DEFAULTS
+        _settings_cache_put(cache_key, dict(_PROJECT_DEFAULTS))
+        return dict(_PROJECT_DEFAULTS)
 
     # Get project-specific settings
     projects = org.get("projects") or {}
     project_settings = projects.get(project_name, {})
 
+    # Fast path: every default key is already present (true for all but the
+    # very first read of a project), so skip the merge allocation and the
+    # deep != comparison below.
+    if project_settings and _PROJECT_DEFAULTS.keys() <= project_settings.keys():
+        _settings_cache_put(cache_key, project_settings)
+        return project_settings
+
     # Merge with defaults
-    merged_project_settings = {**PROJECT_DEFAULTS, **project_settings}
+    merged_project_settings = {**_PROJECT_DEFAULTS, **project_settings}
 
     # Persist back if something changed (safe migration / initialization)
     # Use atomic update to prevent race conditions
     if merged_project_settings != project_settings:
-        try:
-            orgs.update_one(
-                {"team_id": team_id},
-                {"$set": {f"projects.{project_name}": merged_project_settings}},
-            )
-        except Exception as e:
-            # Let exception propagate - calling functions will handle it
-            raise
+        orgs.update_one(
+            {"team_id": team_id},
+            {"$set": {f"projects.{project_name}": merged_project_settings}},
+        )
 
+    _settings_cache_put(cache_key, merged_project_settings)
     return merged_project_settings
 
 
@@ -183,31 +218,36 @@ def set_channel_project(text: str, team_id: str, channel_id: str) -> str:
     except ValueError as e:
         return f"Invalid project name: {str(e)}"
 
-    # Store channel → project binding and preserve welcome_shown flag if it exists
+    # Store channel → project binding and seed project defaults in a single
+    # aggregation-pipeline update instead of read + write + get_settings
+    # bootstrap (three round-trips before).
     # channel_projects structure: {channel_id: {"project": project_name, "welcome_shown": bool}}
-    # Preserve existing welcome_shown value if it exists, don't set it if it doesn't exist
+    channel_path = f"channel_projects.{channel_id}"
+    project_path = f"projects.{project_name}"
     try:
-        org = orgs.find_one({"team_id": team_id}, {"channel_projects": 1}) or {}
-        channel_projects = org.get("channel_projects") or {}
-        channel_info = channel_projects.get(channel_id)
-        
-        # Build the update object - preserve welcome_shown if it exists
-        update_obj = {"project": project_name}
-        if isinstance(channel_info, dict) and "welcome_shown" in channel_info:
-            update_obj["welcome_shown"] = channel_info["welcome_shown"]
-        
         orgs.update_one(
             {"team_id": team_id},
-            {
-                "$set": {
-                    f"channel_projects.{channel_id}": update_obj
-                }
-            },
+            [
+                {
+                    "$set": {
+                        # Merge into the existing dict entry so welcome_shown
+                        # is preserved server-side; legacy string entries are
+                        # replaced with the dict form.
+                        channel_path: {
+                            "$cond": [
+                                {"$eq": [{"$type": f"${channel_path}"}, "object"]},
+                                {"$mergeObjects": [f"${channel_path}", {"project": project_name}]},
+                                {"project": project_name},
+                            ]
+                        },
+                        # Create the project with defaults only if it doesn't exist yet.
+                        project_path: {"$ifNull": [f"${project_path}", dict(_PROJECT_DEFAULTS)]},
+                    }
+                },
+            ],
             upsert=True,
         )
-
-        # Ensure project settings exist (this will also apply defaults if needed)
-        get_settings(team_id, channel_id=channel_id)
+        _invalidate_settings_cache(team_id)
 
         return f"Channel is now using project configuration *{project_name}*."
     except Exception as e:
@@ -218,8 +258,25 @@ def list_projects(team_id: str) -> str:
     # Sanitize input to prevent MongoDB injection
     team_id = sanitize_slack_id(team_id, "team_id")
     try:
-        org = orgs.find_one({"team_id": team_id}, {"projects": 1})
-        projects = sorted((org or {}).get("projects", {}).keys())
+        # Ship only the project names, not every project's full settings:
+        # $objectToArray/$map extracts the keys server-side.
+        pipeline = [
+            {"$match": {"team_id": team_id}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "project_names": {
+                        "$map": {
+                            "input": {"$objectToArray": {"$ifNull": ["$projects", {}]}},
+                            "as": "p",
+                            "in": "$$p.k",
+                        }
+                    },
+                }
+            },
+        ]
+        result = next(orgs.aggregate(pipeline), None)
+        projects = sorted((result or {}).get("project_names") or [])
 
         if not projects:
             return (
@@ -246,19 +303,14 @@ def get_channel_project_name(team_id: str, channel_id: str) -> str | None:
     team_id = sanitize_slack_id(team_id, "team_id")
     channel_id = sanitize_slack_id(channel_id, "channel_id")
     try:
-        org = orgs.find_one({"team_id": team_id}, {"channel_projects": 1})
+        # Dotted-path projection: fetch only this channel's binding instead of
+        # the whole channel_projects map
+        org = orgs.find_one({"team_id": team_id}, {f"channel_projects.{channel_id}": 1})
         if not org:
             return None
-        
+
         channel_projects = org.get("channel_projects") or {}
-        channel_info = channel_projects.get(channel_id)
-        
-        if isinstance(channel_info, dict):
-            return channel_info.get("project")
-        elif channel_info:
-            # Handle old format where channel_id directly maps to project name
-            return channel_info
-        return None
+        return _resolve_project(channel_projects.get(channel_id)) or None
     except Exception as e:
         logger.exception("Error getting channel project name: %s", e)
         return None  # Return None on error to allow graceful degradation
@@ -283,6 +335,35 @@ def _require_project(team_id: str, channel_id: str | None) -> str | None:
     return None
 
 
+def require_project(fn):
+    """
+    Decorator form of _require_project for command handlers taking
+    (.., team_id, channel_id=None, ..). Returns the guard's error message
+    instead of calling the handler when no project is bound. Argument
+    positions are resolved once at decoration time, so the per-call cost
+    is just the guard itself.
+    """
+    params = list(inspect.signature(fn).parameters)
+    team_idx = params.index("team_id")
+    channel_idx = params.index("channel_id") if "channel_id" in params else None
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        team_id = kwargs.get("team_id") if "team_id" in kwargs else args[team_idx]
+        if "channel_id" in kwargs:
+            channel_id = kwargs["channel_id"]
+        elif channel_idx is not None and channel_idx < len(args):
+            channel_id = args[channel_idx]
+        else:
+            channel_id = None
+        error_msg = _require_project(team_id, channel_id)
+        if error_msg:
+            return error_msg
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
 def get_channel_welcome_shown(team_id: str, channel_id: str) -> bool:
     """
     Get whether the welcome message has been shown for a channel from channel_projects.
@@ -292,10 +373,12 @@ def get_channel_welcome_shown(team_id: str, channel_id: str) -> bool:
     team_id = sanitize_slack_id(team_id, "team_id")
     channel_id = sanitize_slack_id(channel_id, "channel_id")
     try:
-        org = orgs.find_one({"team_id": team_id}, {"channel_projects": 1})
+        # Dotted-path projection: fetch only this channel's binding instead of
+        # the whole channel_projects map
+        org = orgs.find_one({"team_id": team_id}, {f"channel_projects.{channel_id}": 1})
         if not org:
             return False
-        
+
         channel_projects = org.get("channel_projects") or {}
         channel_info = channel_projects.get(channel_id)
         
@@ -320,11 +403,32 @@ def set_channel_welcome_shown(team_id: str, channel_id: str, value: bool) -> Non
             {"$set": {f"channel_projects.{channel_id}.welcome_shown": value}},
             upsert=True,
         )
+        _invalidate_settings_cache(team_id)
     except Exception as e:
         logger.exception("Error setting channel welcome shown: %s", e)
         # Don't raise - this is a non-critical operation
 
 
+def _load_channel_bundle(team_id: str, channel_id: str) -> tuple[str | None, dict]:
+    """
+    Load a channel's project name and merged settings with one projected read.
+    Pure-read path: unlike get_settings, this never bootstraps or backfills
+    the org document. Expects already-sanitized IDs.
+    """
+    org = orgs.find_one(
+        {"team_id": team_id},
+        {f"channel_projects.{channel_id}": 1, "projects": 1},
+    ) or {}
+    channel_info = (org.get("channel_projects") or {}).get(channel_id)
+    # Raw name for display, sanitized name for the projects lookup
+    project_name = _resolve_project(channel_info)
+    sanitized_name = _extract_and_sanitize_project_name(channel_info)
+    if not sanitized_name:
+        return project_name, dict(_PROJECT_DEFAULTS)
+    project_settings = (org.get("projects") or {}).get(sanitized_name, {})
+    return project_name, {**_PROJECT_DEFAULTS, **project_settings}
+
+
 def show_channel_status(team_id: str, channel_id: str | None) -> str:
     """
     Show the current channel status including project name, project context, use_project_context flag,
@@ -338,33 +442,87 @@ def show_channel_status(team_id: str, channel_id: str | None) -> str:
     channel_id = sanitize_slack_id(channel_id, "channel_id")
     
     try:
-        project_name = get_channel_project_name(team_id, channel_id)
-        settings = get_settings(team_id, channel_id=channel_id)
+        # One projected read instead of get_channel_project_name + get_settings
+        project_name, settings = _load_channel_bundle(team_id, channel_id)
     except Exception as e:
         return get_mongodb_error_message(e, "show_channel_status")
     
-    project_context = settings.get("project_context", "").strip()
-    use_project_context = settings.get("use_project_context", False)
-    jira_url = settings.get("jira_url", "").strip()
-    jira_token = settings.get("jira_token", "").strip()
-    jira_email = settings.get("jira_email", "").strip()
+    # One pass over the string-valued fields instead of separate
+    # get/strip temporaries per line
+    cleaned = {
+        key: settings.get(key, "").strip()
+        for key in ("project_context", "jira_url", "jira_token", "jira_email")
+    }
     jira_defaults = settings.get("jira_defaults", {})
-    
-    lines = []
-    lines.append(f"*Project name:* {project_name if project_name else 'N/A'}")
-    lines.append(f"*Project context:* {project_context if project_context else 'N/A'}")
-    lines.append(f"*Use project context:* {use_project_context}")
-    lines.append(f"*Jira URL:* {jira_url if jira_url else 'N/A'}")
-    lines.append(f"*Jira token:* {'set' if jira_token else 'not set'}")
-    lines.append(f"*Jira email:* {jira_email if jira_email else 'N/A'}")
-    
-    if jira_defaults:
-        defaults_str = ", ".join(f"{k}={v}" for k, v in sorted(jira_defaults.items()))
-        lines.append(f"*Jira defaults:* {defaults_str}")
-    else:
-        lines.append("*Jira defaults:* none")
-    
-    return "\n".join(lines)
+    defaults_str = (
+        ", ".join(f"{key}={value}" for key, value in sorted(jira_defaults.items()))
+        if jira_defaults
+        else "none"
+    )
+
+    return "\n".join([
+        f"*Project name:* {project_name or 'N/A'}",
+        f"*Project context:* {cleaned['project_context'] or 'N/A'}",
+        f"*Use project context:* {settings.get('use_project_context', False)}",
+        f"*Jira URL:* {cleaned['jira_url'] or 'N/A'}",
+        f"*Jira token:* {'set' if cleaned['jira_token'] else 'not set'}",
+        f"*Jira email:* {cleaned['jira_email'] or 'N/A'}",
+        f"*Jira defaults:* {defaults_str}",
+    ])
+
+
+def _resolve_target_project(team_id: str, channel_id: str | None) -> str:
+    """
+    Resolve which project a settings write should land in: the channel's
+    bound project, or "default" when there is no channel context or binding.
+    Expects already-sanitized IDs; reads only the channel binding.
+    """
+    if channel_id is not None:
+        org = orgs.find_one(
+            {"team_id": team_id}, {f"channel_projects.{channel_id}": 1}
+        ) or {}
+        channel_info = (org.get("channel_projects") or {}).get(channel_id)
+        project_name = _extract_and_sanitize_project_name(channel_info)
+        if project_name:
+            return project_name
+    return "default"
+
+
+def _update_settings_subfields(
+    team_id: str,
+    channel_id: str | None,
+    field: str,
+    updates: dict | None = None,
+    removals=(),
+) -> None:
+    """
+    Per-key $set/$unset into a dict-valued project field (e.g. jira_defaults),
+    so writes are O(keys changed) instead of rewriting the whole subdocument.
+    """
+    # Sanitize inputs to prevent MongoDB injection
+    team_id = sanitize_slack_id(team_id, "team_id")
+    if channel_id is not None:
+        channel_id = sanitize_slack_id(channel_id, "channel_id", allow_none=False)
+
+    updates = updates or {}
+    # Keys become dotted-path components, so reject dots and operators
+    for key in [*updates, *removals]:
+        if not isinstance(key, str) or not key or "." in key or key.startswith("$"):
+            raise ValueError(f"Invalid settings key: {key!r}")
+
+    try:
+        project_name = _resolve_target_project(team_id, channel_id)
+        prefix = f"projects.{project_name}.{field}"
+        ops = {}
+        if updates:
+            ops["$set"] = {f"{prefix}.{key}": value for key, value in updates.items()}
+        if removals:
+            ops["$unset"] = {f"{prefix}.{key}": "" for key in removals}
+        if ops:
+            orgs.update_one({"team_id": team_id}, ops, upsert=True)
+    finally:
+        # Cached settings are stale after any write attempt.
+        _invalidate_settings_cache(team_id)
 
 
 def _update_settings_field(team_id: str, channel_id: str | None, field: str, value) -> None:
@@ -384,75 +542,24 @@ def _update_settings_field(team_id: str, channel_id: str | None, field: str, val
     # Validate field name to prevent injection
     if not isinstance(field, str) or not field.strip():
         raise ValueError("Field name must be a non-empty string")
-    
-    # Fields that belong in projects
-    PROJECT_FIELDS = {
-        "bug_report_template",
-        "project_context",
-        "use_project_context",
-        "jira_token",
-        "jira_url",
-        "jira_bug_query",
-        "jira_email",
-        "jira_defaults",
-    }
-    
+
+    # Idempotent writes (e.g. 'enable docs' sent twice) are common; if the
+    # cached settings already hold this exact value, skip the round-trip.
+    # The cache stays valid because nothing changed.
+    cached = _settings_cache_get((team_id, channel_id))
+    if cached is not None and field in cached and cached[field] == value:
+        return
+
     try:
-        org = orgs.find_one({"team_id": team_id}) or {}
-        
-        # For project-specific fields, always update projects
-        if field in PROJECT_FIELDS:
-            if channel_id is not None:
-                channel_projects = org.get("channel_projects") or {}
-                channel_info = channel_projects.get(channel_id)
-                
-                # Extract and sanitize project name
-                project_name = _extract_and_sanitize_project_name(channel_info)
-                
-                if project_name:
-                    
-                    # Update the bound project
-                    orgs.update_one(
-                        {"team_id": team_id},
-                        {"$set": {f"projects.{project_name}.{field}": value}},
-                        upsert=True,
-                    )
-                    return
-            
-            # If no channel_id or channel not bound to project, use/create default project
-            # Default project name is "default"
-            default_project = "default"
-            orgs.update_one(
-                {"team_id": team_id},
-                {"$set": {f"projects.{default_project}.{field}": value}},
-                upsert=True,
-            )
-            return
-        
-        # Unknown field - default to project update
-        if channel_id is not None:
-            channel_projects = org.get("channel_projects") or {}
-            channel_info = channel_projects.get(channel_id)
-            
-            # Extract and sanitize project name
-            project_name = _extract_and_sanitize_project_name(channel_info)
-                
-            if project_name:
-                
-                orgs.update_one(
-                    {"team_id": team_id},
-                    {"$set": {f"projects.{project_name}.{field}": value}},
-                    upsert=True,
-                )
-                return
-        
-        # Fallback: update in default project
-        default_project = "default"
+        # All fields live under the resolved project ("default" when the
+        # channel has no binding), so one resolve + one write covers every
+        # case - the old known/unknown-field branches were identical.
+        project_name = _resolve_target_project(team_id, channel_id)
         orgs.update_one(
             {"team_id": team_id},
-            {"$set": {f"projects.{default_project}.{field}": value}},
+            {"$set": {f"projects.{project_name}.{field}": value}},
             upsert=True,
         )
-    except Exception as e:
-        # Let exception propagate - calling functions will handle it
-        raise
+    finally:
+        # Cached settings are stale after any write attempt.
+        _invalidate_settings_cache(team_id)
@@ -5,6 +5,7 @@ Uses sliding window algorithm for daily rate limiting.
 import os
 from datetime import datetime, timedelta
 from typing import Optional
+from pymongo import ReturnDocument
 from pymongo.errors import PyMongoError
 
 from bot.db import rate_limits
@@ -53,86 +54,83 @@ class RateLimiter:
         try:
             # Sanitize input
             team_id = sanitize_slack_id(team_id, "team_id")
-            
+
             key = self._get_rate_limit_key(team_id)
             now = datetime.utcnow()
             window_start = now - timedelta(seconds=self.window_seconds)
-            
-            # Get or create rate limit document
-            rate_limit_doc = rate_limits.find_one({"rate_limit_key": key})
-            
-            if not rate_limit_doc:
-                # First request - create document
-                rate_limits.insert_one({
-                    "rate_limit_key": key,
-                    "team_id": team_id,
-                    "requests": [now],
-                    "created_at": now,
-                    "updated_at": now,
-                })
-                return True, None
-            
-            # Clean old requests outside the window
-            requests = rate_limit_doc.get("requests", [])
-            # Filter out requests older than window_start
-            # Handle both datetime objects and ISO strings
-            valid_requests = []
-            for req in requests:
-                if isinstance(req, datetime):
-                    if req >= window_start:
-                        valid_requests.append(req)
-                elif isinstance(req, str):
-                    # Try to parse ISO string
-                    try:
-                        req_dt = datetime.fromisoformat(req.replace('Z', '+00:00'))
-                        if req_dt >= window_start:
-                            valid_requests.append(req_dt)
-                    except (ValueError, AttributeError):
-                        # Skip invalid date strings
-                        continue
-            
-            # Check if limit exceeded
-            if len(valid_requests) >= self.max_requests:
-                # Calculate time until oldest request expires
-                if valid_requests:
-                    oldest_request = min(valid_requests)
-                    reset_time = oldest_request + timedelta(seconds=self.window_seconds)
-                    time_until_reset = (reset_time - now).total_seconds()
-                    
-                    if time_until_reset > 0:
-                        # Convert to hours and minutes for better readability
-                        hours = int(time_until_reset // 3600)
-                        minutes = int((time_until_reset % 3600) // 60)
-                        
-                        if hours > 0:
-                            wait_msg = f"{hours} hour{'s' if hours != 1 else ''}"
-                            if minutes > 0:
-                                wait_msg += f" and {minutes} minute{'s' if minutes != 1 else ''}"
-                        else:
-                            wait_msg = f"{minutes} minute{'s' if minutes != 1 else ''}"
-                        
-                        return False, (
-                            f"You've reached the daily limit of {self.max_requests} AI requests. "
-                            f"Please try again in {wait_msg}. "
-                            f"(Limit resets daily)"
-                        )
-            
-            # Add current request
-            valid_requests.append(now)
-            
-            # Update document
-            rate_limits.update_one(
-                {"rate_limit_key": key},
-                {
-                    "$set": {
-                        "requests": valid_requests,
-                        "updated_at": now,
-                    }
+
+            # Prune the window, decide, and record the request in one atomic
+            # pipeline update - a single round-trip instead of find_one plus
+            # update_one, with no read-modify-write race between workers.
+            # All expressions below evaluate against the pre-update document.
+            # Non-datetime entries (legacy ISO strings) sort below dates in
+            # BSON and are pruned as expired.
+            pruned = {
+                "$filter": {
+                    "input": {"$ifNull": ["$requests", []]},
+                    "as": "req",
+                    "cond": {"$gte": ["$$req", window_start]},
                 }
+            }
+            allowed = {"$lt": [{"$size": pruned}, self.max_requests]}
+            doc = rate_limits.find_one_and_update(
+                {"rate_limit_key": key},
+                [
+                    {
+                        "$set": {
+                            "rate_limit_key": key,
+                            "team_id": team_id,
+                            "requests": {
+                                "$cond": [
+                                    allowed,
+                                    {"$concatArrays": [pruned, [now]]},
+                                    pruned,
+                                ]
+                            },
+                            "allowed": allowed,
+                            "created_at": {"$ifNull": ["$created_at", now]},
+                            "updated_at": now,
+                        }
+                    },
+                ],
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+                projection={"allowed": 1, "requests": 1},
             )
-            
-            return True, None
-            
+
+            if doc is None or doc.get("allowed", True):
+                return True, None
+
+            # Rejected: report time until the oldest request leaves the window
+            valid_requests = doc.get("requests", [])
+            if valid_requests:
+                oldest_request = min(valid_requests)
+                reset_time = oldest_request + timedelta(seconds=self.window_seconds)
+                time_until_reset = (reset_time - now).total_seconds()
+
+                if time_until_reset > 0:
+                    # Convert to hours and minutes for better readability
+                    hours = int(time_until_reset // 3600)
+                    minutes = int((time_until_reset % 3600) // 60)
+
+                    if hours > 0:
+                        wait_msg = f"{hours} hour{'s' if hours != 1 else ''}"
+                        if minutes > 0:
+                            wait_msg += f" and {minutes} minute{'s' if minutes != 1 else ''}"
+                    else:
+                        wait_msg = f"{minutes} minute{'s' if minutes != 1 else ''}"
+
+                    return False, (
+                        f"You've reached the daily limit of {self.max_requests} AI requests. "
+                        f"Please try again in {wait_msg}. "
+                        f"(Limit resets daily)"
+                    )
+
+            return False, (
+                f"You've reached the daily limit of {self.max_requests} AI requests. "
+                f"Please try again later. (Limit resets daily)"
+            )
+
         except PyMongoError as e:
             logger.exception("MongoDB error in rate limiter for team_id=%s: %s", team_id, e)
             # On database error, allow the request (fail open)
@@ -1,51 +1,78 @@
+import functools
 import re
+import string
+
+from pymongo.errors import (
+    ConnectionFailure,
+    ServerSelectionTimeoutError,
+    OperationFailure,
+    PyMongoError,
+)
 
 from bot.constants import MAX_SLACK_ID_LENGTH, MAX_PROJECT_NAME_LENGTH
+from bot.logger import logger
+
+# Valid Slack ID alphabet; one frozenset membership scan replaces the old
+# battery of regex checks (every dangerous character is outside this set)
+_SLACK_ID_ALLOWED = frozenset(string.ascii_letters + string.digits + "_-")
+
+# Characters project names must never contain (Mongo dotted paths and
+# operators); one intersection scan classifies the offender
+_PROJECT_NAME_FORBIDDEN = frozenset('.${}')
 
 
 def contains(text: str, keywords: list[str]) -> bool:
     return any(k in text for k in keywords)
 
+# Compiled patterns for command phrases, built lazily on first use.
+# The command vocabulary is small and fixed, so this saves re-lowercasing
+# the full message text on every call.
+_COMMAND_RE_CACHE: dict[str, re.Pattern] = {}
+
+
+def _command_pattern(command: str) -> re.Pattern:
+    pattern = _COMMAND_RE_CACHE.get(command)
+    if pattern is None:
+        pattern = re.compile(re.escape(command.strip()), re.IGNORECASE)
+        _COMMAND_RE_CACHE[command] = pattern
+    return pattern
+
+
 def strip_command(text: str, command: str) -> str:
     """
     Remove the command phrase from text and return the remaining payload.
     Handles case-insensitive matching and ensures clean extraction.
-    
+
     Args:
         text: The full text (should already have bot mention removed)
         command: The command phrase to remove (case-insensitive)
-        
+
     Returns:
         The text with the command phrase removed, stripped of whitespace
     """
     if not text or not command:
         return text.strip() if text else ""
-    
-    # Normalize both to lowercase for finding, but DON'T strip text yet
-    # We need to preserve the original positions
-    lowered_text = text.lower()
-    lowered_command = command.lower().strip()
-    
-    # Find the command in the text (case-insensitive)
-    idx = lowered_text.find(lowered_command)
-    if idx == -1:
+
+    # Locate the command case-insensitively with a precompiled pattern -
+    # a single C-level scan, no lowercased copies of text or command.
+    match = _command_pattern(command).search(text)
+    if match is None:
         # Command not found, return original text stripped
         return text.strip()
-    
-    # Calculate where the command ends in the original text
-    # The positions align because we're doing case-insensitive matching
-    command_end = idx + len(command)
-    
-    # Extract everything after the command and immediately remove leading whitespace
-    after = text[command_end:].lstrip()
-    
-    # Get everything before the command (in case there's extra text)
-    before = text[:idx]
-    
-    # Combine - before should be empty if command is at start, after is already stripped
-    cleaned = (before + after).strip()
-    
-    return cleaned
+
+    # Strip each side exactly once; the common case (command at the start)
+    # returns the payload without concatenating or re-scanning anything
+    after = text[match.end():].strip()
+    if match.start() == 0:
+        return after
+
+    # Extra text before the command (rare)
+    before = text[:match.start()].strip()
+    if not before:
+        return after
+    if not after:
+        return before
+    return before + " " + after
 
 
 def strip_leading_mention(text: str) -> str:
@@ -53,7 +80,16 @@ def strip_leading_mention(text: str) -> str:
     Remove a leading Slack user mention like '<@U123ABC>' plus any following whitespace.
     This helps us reason about the actual user message length and content.
     """
-    return re.sub(r"^<@[^>]+>\s*", "", text or "").strip()
+    if not text:
+        return ""
+    # Pure str ops: memcmp prefix check, memchr scan for the closing '>'.
+    # end > 2 preserves the old pattern's requirement of at least one
+    # character between '<@' and '>'.
+    if text.startswith('<@'):
+        end = text.find('>', 2)
+        if end > 2:
+            return text[end + 1:].strip()
+    return text.strip()
 
 
 def sanitize_slack_id(identifier: str | None, name: str = "identifier", allow_none: bool = False) -> str | None:
@@ -85,43 +121,82 @@ def sanitize_slack_id(identifier: str | None, name: str = "identifier", allow_no
     
     if not isinstance(identifier, str):
         raise ValueError(f"{name} must be a string, got {type(identifier).__name__}")
-    
+
+    # Fast path for real Slack IDs (ASCII alphanumeric like U01ABCDEFGH):
+    # isalnum+isascii prove there is no whitespace to strip and nothing
+    # outside the allowed alphabet, so even the memo lookup can be skipped
+    if identifier.isascii() and identifier.isalnum() and len(identifier) <= MAX_SLACK_ID_LENGTH:
+        return identifier
+
+    return _sanitize_slack_id_cached(identifier, name)
+
+
+# Validation is pure and the same handful of team/channel IDs recur on every
+# event, so memoize the regex work. Only successful results are cached
+# (lru_cache does not cache raised exceptions), keeping rejects re-checked.
+@functools.lru_cache(maxsize=4096)
+def _sanitize_slack_id_cached(identifier: str, name: str) -> str:
     # Remove whitespace
     identifier = identifier.strip()
     
     if not identifier:
         raise ValueError(f"{name} cannot be empty after stripping whitespace")
     
-    # Check for MongoDB operators that could be used for injection
-    # These patterns indicate potential operator injection attempts
-    dangerous_patterns = [
-        r'\$[a-z]+',  # MongoDB operators like $gt, $ne, $regex
-        r'^\$',       # Starting with $
-        r'\{',        # Object notation
-        r'\}',        # Object notation
-    ]
+    # Length first: cheap, and short-circuits the character scan for
+    # oversized input
+    if len(identifier) > MAX_SLACK_ID_LENGTH:
+        raise ValueError(f"{name} is too long (max {MAX_SLACK_ID_LENGTH} characters): {len(identifier)}")
     
-    for pattern in dangerous_patterns:
-        if re.search(pattern, identifier, re.IGNORECASE):
+    # Allow alphanumeric, hyphens, underscores (Slack ID format).
+    # One C-level set-membership scan; $ / { / } and every other MongoDB
+    # injection character are outside the allowed alphabet, so the old
+    # operator checks are subsumed - only the error message distinguishes
+    # injection-looking input.
+    if not _SLACK_ID_ALLOWED.issuperset(identifier):
+        if '$' in identifier or '{' in identifier or '}' in identifier:
             raise ValueError(
                 f"{name} contains invalid characters that could be used for injection: {identifier}"
             )
-    
-    # Allow alphanumeric, hyphens, underscores (Slack ID format)
-    # Slack IDs are typically uppercase alphanumeric, but we're lenient
-    if not re.match(r'^[A-Za-z0-9_-]+$', identifier):
         raise ValueError(
             f"{name} contains invalid characters. "
             f"Only alphanumeric characters, hyphens, and underscores are allowed: {identifier}"
         )
     
-    # Reasonable length limit
-    if len(identifier) > MAX_SLACK_ID_LENGTH:
-        raise ValueError(f"{name} is too long (max {MAX_SLACK_ID_LENGTH} characters): {len(identifier)}")
-    
     return identifier
 
 
+def sanitize_slack_ids(
+    ids: dict[str, str | None],
+    allow_none_for: frozenset[str] = frozenset(),
+) -> dict[str, str | None]:
+    """
+    Batch variant of sanitize_slack_id for validating several IDs at the
+    event boundary in one pass. Keys are the identifier names (used in error
+    messages), values the raw IDs; names listed in allow_none_for may be None.
+
+    Returns a new dict of sanitized values.
+
+    Raises:
+        ValueError: If any identifier is invalid.
+    """
+    sanitized: dict[str, str | None] = {}
+    for name, identifier in ids.items():
+        # Inline fast path, mirroring sanitize_slack_id: plain ASCII
+        # alphanumerics need no stripping or character checks
+        if (
+            isinstance(identifier, str)
+            and identifier.isascii()
+            and identifier.isalnum()
+            and len(identifier) <= MAX_SLACK_ID_LENGTH
+        ):
+            sanitized[name] = identifier
+        else:
+            sanitized[name] = sanitize_slack_id(
+                identifier, name, allow_none=name in allow_none_for
+            )
+    return sanitized
+
+
 def sanitize_project_name(project_name: str) -> str:
     """
     Sanitize and validate project names to prevent MongoDB injection.
@@ -144,49 +219,71 @@ def sanitize_project_name(project_name: str) -> str:
     if not isinstance(project_name, str):
         raise ValueError(f"Project name must be a string, got {type(project_name).__name__}")
     
+    return _sanitize_project_name_cached(project_name)
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_project_name_cached(project_name: str) -> str:
     # Remove leading/trailing whitespace
     project_name = project_name.strip()
     
     if not project_name:
         raise ValueError("Project name cannot be empty after stripping whitespace")
-    
-    # Check for dangerous characters that could be used for MongoDB injection
-    # Dots (.) are dangerous because they're used in dot notation for nested fields
-    # Dollar signs ($) are MongoDB operators
-    if '.' in project_name:
-        raise ValueError(
-            "Project name cannot contain dots (.) as they are used for MongoDB field paths. "
-            f"Invalid name: {project_name}"
-        )
-    
-    if '$' in project_name:
-        raise ValueError(
-            "Project name cannot contain dollar signs ($) as they are MongoDB operators. "
-            f"Invalid name: {project_name}"
-        )
-    
-    # Check for MongoDB operators in the name
-    if re.search(r'\$[a-z]+', project_name, re.IGNORECASE):
+
+    # Length first (also checked in set_channel_project): bounds the work the
+    # character scan below does on oversized untrusted input
+    if len(project_name) > MAX_PROJECT_NAME_LENGTH:
         raise ValueError(
-            f"Project name contains MongoDB operators: {project_name}"
+            f"Project name is too long (max {MAX_PROJECT_NAME_LENGTH} characters): {len(project_name)}"
         )
-    
-    # Check for object notation
-    if '{' in project_name or '}' in project_name:
+
+    # Check for dangerous characters that could be used for MongoDB injection
+    # in one pass: dots are used in dot notation for nested field paths,
+    # dollar signs are MongoDB operators, braces are object notation. The old
+    # \$[a-z]+ operator regex was redundant - the plain '$' check is a
+    # superset of it.
+    hit = _PROJECT_NAME_FORBIDDEN.intersection(project_name)
+    if hit:
+        if '.' in hit:
+            raise ValueError(
+                "Project name cannot contain dots (.) as they are used for MongoDB field paths. "
+                f"Invalid name: {project_name}"
+            )
+        if '$' in hit:
+            raise ValueError(
+                "Project name cannot contain dollar signs ($) as they are MongoDB operators. "
+                f"Invalid name: {project_name}"
+            )
         raise ValueError(
             "Project name cannot contain braces ({}). "
             f"Invalid name: {project_name}"
         )
-    
-    # Reasonable length limit (already checked in set_channel_project, but enforce here too)
-    if len(project_name) > MAX_PROJECT_NAME_LENGTH:
-        raise ValueError(
-            f"Project name is too long (max {MAX_PROJECT_NAME_LENGTH} characters): {len(project_name)}"
-        )
-    
+
     return project_name
 
 
+# Exception class -> user-facing message; looked up via the error's MRO so
+# subclasses inherit their ancestor's message
+_MONGO_ERROR_MESSAGES: dict[type, str] = {
+    ConnectionFailure: (
+        "I'm having trouble connecting to the database. "
+        "Please try again in a moment."
+    ),
+    ServerSelectionTimeoutError: (
+        "I'm having trouble connecting to the database. "
+        "Please try again in a moment."
+    ),
+    OperationFailure: (
+        "A database operation failed. "
+        "Please try again or contact support if the issue persists."
+    ),
+    PyMongoError: (
+        "A database error occurred. "
+        "Please try again in a moment."
+    ),
+}
+
+
 def get_mongodb_error_message(error: Exception, operation_name: str = "operation") -> str:
     """
     Convert MongoDB errors to user-friendly messages.
@@ -198,35 +295,16 @@ def get_mongodb_error_message(error: Exception, operation_name: str = "operation
     Returns:
         User-friendly error message string
     """
-    from pymongo.errors import (
-        ConnectionFailure,
-        ServerSelectionTimeoutError,
-        OperationFailure,
-        PyMongoError,
-    )
-    from bot.logger import logger
-    
     logger.exception("MongoDB error in %s: %s", operation_name, str(error))
     
-    # Provide specific error messages based on error type
-    if isinstance(error, (ConnectionFailure, ServerSelectionTimeoutError)):
-        return (
-            "I'm having trouble connecting to the database. "
-            "Please try again in a moment."
-        )
-    elif isinstance(error, OperationFailure):
-        return (
-            "A database operation failed. "
-            "Please try again or contact support if the issue persists."
-        )
-    elif isinstance(error, PyMongoError):
-        return (
-            "A database error occurred. "
-            "Please try again in a moment."
-        )
-    else:
-        # For non-MongoDB errors that might occur, use generic message
-        return (
-            "An unexpected error occurred while accessing the database. "
-            "Please try again or contact support."
-        )
+    # Single MRO walk against the class-keyed table instead of an isinstance
+    # ladder; subclasses resolve to their nearest mapped ancestor
+    for cls in type(error).__mro__:
+        message = _MONGO_ERROR_MESSAGES.get(cls)
+        if message is not None:
+            return message
+    # For non-MongoDB errors that might occur, use generic message
+    return (
+        "An unexpected error occurred while accessing the database. "
+        "Please try again or contact support."
+    )